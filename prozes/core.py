@@ -1,43 +1,26 @@
 """Prozes CLI - Python project generator."""
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 import click
-from prozes.modules.dirs import create_project_folder, command_git
-from prozes.modules.venv import criar_venv, instalar_dependencias
-from prozes.modules.install import create_default_requirements, create_env_example
-from prozes.modules.structures import (
-    create_mvc_structure,
-    create_api_structure,
-    create_cli_structure,
-    create_clean_structure,
-)
-from prozes.modules.console import (
-    console,
-    print_header,
-    print_success,
-    print_error,
-    print_info,
-    print_step,
-    print_summary,
-    print_next_steps,
-    print_template_info,
-    print_template_tree,
-    print_template_list,
-    ICONS,
-)
-from prozes.modules.i18n import t, set_language
-from prozes.modules.validation import run_all_validations, validate_project_name
-from prozes.modules.templates import (
-    create_template_from_directory,
-    list_custom_templates,
-    get_template,
-    apply_template,
-    delete_template,
-    template_exists,
-    validate_template_name,
-)
-from prozes.modules.update_checker import check_and_prompt_update
+from prozes.modules.i18n import t, set_language, get_language
+
+# Caminhos de config resolvidos uma vez no import
+_PROZES_HOME = Path.home() / '.prozes'
+_CONFIG_FILE = _PROZES_HOME / 'config'
+
+
+@lru_cache(maxsize=512)
+def _t_cached(lang, key):
+    """Traducao memoizada dos textos de help (o idioma faz parte da chave)."""
+    return t(key)
+
+
+def _t_help(key):
+    """Retorna o texto de help traduzido pro idioma atual."""
+    return _t_cached(get_language(), key)
 
 
 class LanguageOption(click.Option):
@@ -49,13 +32,14 @@ class LanguageOption(click.Option):
 
     def handle_parse_result(self, ctx, opts, args):
         # Only override if user explicitly passed --lang
-        if 'lang' in opts and opts['lang'] is not None:
-            set_language(opts['lang'])
+        lang = opts.get('lang')
+        if lang:
+            set_language(lang)
         return super().handle_parse_result(ctx, opts, args)
 
     def get_help_record(self, ctx):
         if self.help_key:
-            self.help = t(self.help_key)
+            self.help = _t_help(self.help_key)
         return super().get_help_record(ctx)
 
 
@@ -68,12 +52,12 @@ class TranslatedGroup(click.Group):
 
     def get_short_help_str(self, limit=150):
         if self.help_key:
-            return t(self.help_key)[:limit]
+            return _t_help(self.help_key)[:limit]
         return super().get_short_help_str(limit)
 
     def format_help(self, ctx, formatter):
         if self.help_key:
-            self.help = t(self.help_key)
+            self.help = _t_help(self.help_key)
         super().format_help(ctx, formatter)
 
 
@@ -87,14 +71,14 @@ class TranslatedCommand(click.Command):
 
     def get_short_help_str(self, limit=150):
         if self.help_key:
-            return t(self.help_key)[:limit]
+            return _t_help(self.help_key)[:limit]
         return super().get_short_help_str(limit)
 
     def format_help(self, ctx, formatter):
         if self.help_key:
-            help_text = t(self.help_key)
+            help_text = _t_help(self.help_key)
             if self.help_long_key:
-                help_text += "\n\n" + t(self.help_long_key)
+                help_text += "\n\n" + _t_help(self.help_long_key)
             self.help = help_text
         super().format_help(ctx, formatter)
 
@@ -108,14 +92,20 @@ class TranslatedOption(click.Option):
 
     def get_help_record(self, ctx):
         if self.help_key:
-            self.help = t(self.help_key)
+            self.help = _t_help(self.help_key)
         return super().get_help_record(ctx)
 
 
+# Choice types shared by every option that accepts the same values
+_LANG_CHOICE = click.Choice(('en', 'pt', 'es', 'it', 'fr'), case_sensitive=False)
+_AUTH_CHOICE = click.Choice(('none', 'jwt', 'oauth2', 'session', 'basic'), case_sensitive=False)
+_FRAMEWORK_CHOICE = click.Choice(('flask', 'fastapi'), case_sensitive=False)
+
+
 @click.group(cls=TranslatedGroup, help_key='help_main')
 @click.option(
     '--lang', '-L',
-    type=click.Choice(['en', 'pt', 'es', 'it', 'fr'], case_sensitive=False),
+    type=_LANG_CHOICE,
     default=None,
     cls=LanguageOption,
     is_eager=True,
@@ -125,7 +115,6 @@ class TranslatedOption(click.Option):
 @click.pass_context
 def cli(ctx, lang):
     """Prozes - gerador de projetos Python com arquiteturas prontas."""
-    from prozes.modules.i18n import get_language
     ctx.ensure_object(dict)
     ctx.obj['lang'] = lang if lang else get_language()
 
@@ -134,25 +123,35 @@ def cli(ctx, lang):
 # Common options decorator
 # =============================================================================
 
+# Built once; click creates a new Option each time a decorator is applied.
+# Applied in this order, so --verbose ends up last in the help output.
+_COMMON_OPTIONS = (
+    click.option('-v', '--verbose', is_flag=True,
+                 cls=TranslatedOption, help_key='help_verbose'),
+    click.option('--git', is_flag=True,
+                 cls=TranslatedOption, help_key='help_git'),
+    click.option('--venv', is_flag=True,
+                 cls=TranslatedOption, help_key='help_venv'),
+    click.option('--python-version', type=str, default=None,
+                 cls=TranslatedOption, help_key='help_python_version'),
+    click.option('--install-deps', is_flag=True,
+                 cls=TranslatedOption, help_key='help_install_deps'),
+    click.option('--auth', type=_AUTH_CHOICE, default='none',
+                 cls=TranslatedOption, help_key='help_auth'),
+)
+
+
 def common_options(f):
     """Decorator que adiciona as opções comuns em todos os comandos."""
-    f = click.option('-v', '--verbose', is_flag=True,
-                     cls=TranslatedOption, help_key='help_verbose')(f)
-    f = click.option('--git', is_flag=True,
-                     cls=TranslatedOption, help_key='help_git')(f)
-    f = click.option('--venv', is_flag=True,
-                     cls=TranslatedOption, help_key='help_venv')(f)
-    f = click.option('--python-version', type=str, default=None,
-                     cls=TranslatedOption, help_key='help_python_version')(f)
-    f = click.option('--install-deps', is_flag=True,
-                     cls=TranslatedOption, help_key='help_install_deps')(f)
-    f = click.option('--auth', type=click.Choice(['none', 'jwt', 'oauth2', 'session', 'basic'], case_sensitive=False),
-                     default='none', cls=TranslatedOption, help_key='help_auth')(f)
+    for option in _COMMON_OPTIONS:
+        f = option(f)
     return f
 
 
 def validate_and_exit_on_error(project_name, git, venv, python_version, install_deps):
     """Valida as entradas e sai com erro se algo estiver errado."""
+    from prozes.modules.validation import run_all_validations
+
     errors = run_all_validations(
         project_name=project_name,
         git=git,
@@ -162,6 +161,8 @@ def validate_and_exit_on_error(project_name, git, venv, python_version, install_
     )
 
     if errors:
+        from prozes.modules.console import console, print_error
+
         console.print()
         console.print(f"[bold red]{t('validation_errors_header')}:[/bold red]")
         for error in errors:
@@ -170,44 +171,77 @@ def validate_and_exit_on_error(project_name, git, venv, python_version, install_
         sys.exit(1)
 
 
-def finalize_project(project_path, project_name, project_type, verbose, git, venv, python_version, install_deps, auth='none'):
-    """Finaliza a criação do projeto (venv, git, deps)."""
+def finalize_project(project_path, project_name, project_type, verbose, git, venv, python_version, install_deps, auth='none', batch=None):
+    """Finaliza a criação do projeto (venv, git, deps).
+
+    Se ``batch`` vier da criação da estrutura, os arquivos de requirements e
+    .env.example entram no mesmo batch, que é gravado antes do venv/git.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from prozes.modules.console import (
+        ICONS,
+        console,
+        print_info,
+        print_step,
+        print_success,
+        print_summary,
+    )
+    from prozes.modules.fsbatch import FSBatch
+    from prozes.modules.install import create_default_requirements, create_env_example
+
     options = {'venv': False, 'git': False, 'deps': False}
 
-    # Create requirements.txt
-    create_default_requirements(project_path, project_type, auth)
-    if verbose:
-        print_info(t('requirements_created'))
+    # The venv is built in a background thread while the project files are
+    # written; its result is still reported first, before Git prompts the
+    # user, so the output order (and where a venv failure shows up) is the
+    # same as creating it inline.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        venv_future = None
+        if venv:
+            from prozes.modules.venv import criar_venv
+            venv_future = executor.submit(criar_venv, project_path, python_version, verbose=False)
 
-    # Create .env.example
-    create_env_example(project_path, project_type, auth)
-    if verbose:
-        print_info('.env.example criado')
+        if batch is None:
+            batch = FSBatch(project_path)
+
+        # Create requirements.txt and .env.example, then flush everything to disk
+        create_default_requirements(project_path, project_type, auth, batch=batch)
+        create_env_example(project_path, project_type, auth, batch=batch)
+        batch.commit()
 
-    # Print auth configuration message
-    if auth != 'none':
-        print_success(f"{t('auth_configured')}: {auth.upper()}")
         if verbose:
-            print_info(t('auth_warning_database'))
+            print_info(t('requirements_created'))
+            print_info('.env.example criado')
 
-    # Virtual environment setup
-    if venv:
-        console.print()
-        print_step(f"{ICONS['python']} {t('creating_venv')}")
-        venv_success = criar_venv(project_path, python_version, verbose=False)
-        if venv_success:
-            options['venv'] = True
-            print_success(t('venv_created'))
-
-            if install_deps:
-                print_step(f"{ICONS['package']} {t('installing_deps')}")
-                deps_success = instalar_dependencias(project_path, 'requirements.txt', verbose=False)
-                if deps_success:
-                    options['deps'] = True
-                    print_success(t('deps_installed'))
+        # Print auth configuration message
+        if auth != 'none':
+            print_success(f"{t('auth_configured')}: {auth.upper()}")
+            if verbose:
+                print_info(t('auth_warning_database'))
+
+        # Virtual environment setup
+        if venv_future is not None:
+            from prozes.modules.venv import instalar_dependencias
+
+            console.print()
+            print_step(f"{ICONS['python']} {t('creating_venv')}")
+            venv_success = venv_future.result()
+            if venv_success:
+                options['venv'] = True
+                print_success(t('venv_created'))
+
+                if install_deps:
+                    print_step(f"{ICONS['package']} {t('installing_deps')}")
+                    deps_success = instalar_dependencias(project_path, 'requirements.txt', verbose=False)
+                    if deps_success:
+                        options['deps'] = True
+                        print_success(t('deps_installed'))
 
     # Git initialization
     if git:
+        from prozes.modules.dirs import command_git
+
         console.print()
         print_step(f"{ICONS['git']} {t('initializing_git')}")
         git_success = command_git(project_path, verbose=verbose)
@@ -229,7 +263,7 @@ def finalize_project(project_path, project_name, project_type, verbose, git, ven
 @click.argument('project_name')
 @click.option(
     '-t', '--type', 'project_type',
-    type=click.Choice(['web-flask', 'web-fastapi'], case_sensitive=False),
+    type=click.Choice(('web-flask', 'web-fastapi'), case_sensitive=False),
     default='web-flask',
     cls=TranslatedOption, help_key='help_mvc_type'
 )
@@ -239,7 +273,19 @@ def mvc(ctx, project_name, project_type, verbose, git, venv, python_version, ins
     """Create a project with MVC architecture."""
     validate_and_exit_on_error(project_name, git, venv, python_version, install_deps)
 
+    from prozes.modules.console import (
+        console,
+        print_error,
+        print_header,
+        print_next_steps,
+        print_step,
+    )
+    from prozes.modules.dirs import create_project_folder
+    from prozes.modules.fsbatch import FSBatch
+    from prozes.modules.structures import create_mvc_structure
+
     # Check for updates before creating project
+    from prozes.modules.update_checker import check_and_prompt_update
     check_and_prompt_update(lang=ctx.obj.get('lang', 'en'))
 
     try:
@@ -248,9 +294,10 @@ def mvc(ctx, project_name, project_type, verbose, git, venv, python_version, ins
 
         project_path = create_project_folder(project_name, verbose=False)
         print_step(t('creating_folder_structure'))
-        create_mvc_structure(project_path, project_type, auth, verbose)
+        batch = FSBatch(project_path)
+        create_mvc_structure(project_path, project_type, auth, verbose, batch=batch)
 
-        options = finalize_project(project_path, project_name, project_type, verbose, git, venv, python_version, install_deps, auth)
+        options = finalize_project(project_path, project_name, project_type, verbose, git, venv, python_version, install_deps, auth, batch=batch)
 
         # Next steps
         steps = [f"cd {project_name}"]
@@ -278,7 +325,7 @@ def mvc(ctx, project_name, project_type, verbose, git, venv, python_version, ins
 @click.argument('project_name')
 @click.option(
     '-t', '--type', 'project_type',
-    type=click.Choice(['flask', 'fastapi'], case_sensitive=False),
+    type=_FRAMEWORK_CHOICE,
     default='fastapi',
     cls=TranslatedOption, help_key='help_api_type'
 )
@@ -288,7 +335,19 @@ def api(ctx, project_name, project_type, verbose, git, venv, python_version, ins
     """Create a pure REST API (no frontend)."""
     validate_and_exit_on_error(project_name, git, venv, python_version, install_deps)
 
+    from prozes.modules.console import (
+        console,
+        print_error,
+        print_header,
+        print_next_steps,
+        print_step,
+    )
+    from prozes.modules.dirs import create_project_folder
+    from prozes.modules.fsbatch import FSBatch
+    from prozes.modules.structures import create_api_structure
+
     # Check for updates before creating project
+    from prozes.modules.update_checker import check_and_prompt_update
     check_and_prompt_update(lang=ctx.obj.get('lang', 'en'))
 
     try:
@@ -298,9 +357,10 @@ def api(ctx, project_name, project_type, verbose, git, venv, python_version, ins
 
         project_path = create_project_folder(project_name, verbose=False)
         print_step(t('creating_folder_structure'))
-        create_api_structure(project_path, full_type, auth, verbose)
+        batch = FSBatch(project_path)
+        create_api_structure(project_path, full_type, auth, verbose, batch=batch)
 
-        options = finalize_project(project_path, project_name, full_type, verbose, git, venv, python_version, install_deps, auth)
+        options = finalize_project(project_path, project_name, full_type, verbose, git, venv, python_version, install_deps, auth, batch=batch)
 
         # Next steps
         steps = [f"cd {project_name}"]
@@ -332,15 +392,27 @@ def cli_cmd(project_name, verbose, git, venv, python_version, install_deps, auth
     """Create a CLI project with Click."""
     validate_and_exit_on_error(project_name, git, venv, python_version, install_deps)
 
+    from prozes.modules.console import (
+        console,
+        print_error,
+        print_header,
+        print_next_steps,
+        print_step,
+    )
+    from prozes.modules.dirs import create_project_folder
+    from prozes.modules.fsbatch import FSBatch
+    from prozes.modules.structures import create_cli_structure
+
     try:
         print_header(f"{t('creating_project_cli')}: {project_name}", "click")
         console.print()
 
         project_path = create_project_folder(project_name, verbose=False)
         print_step(t('creating_folder_structure'))
-        create_cli_structure(project_path, verbose)
+        batch = FSBatch(project_path)
+        create_cli_structure(project_path, verbose, batch=batch)
 
-        options = finalize_project(project_path, project_name, 'cli', verbose, git, venv, python_version, install_deps, auth)
+        options = finalize_project(project_path, project_name, 'cli', verbose, git, venv, python_version, install_deps, auth, batch=batch)
 
         # Next steps
         steps = [
@@ -366,7 +438,7 @@ def cli_cmd(project_name, verbose, git, venv, python_version, install_deps, auth
 @click.argument('project_name')
 @click.option(
     '-t', '--type', 'project_type',
-    type=click.Choice(['flask', 'fastapi'], case_sensitive=False),
+    type=_FRAMEWORK_CHOICE,
     default='flask',
     cls=TranslatedOption, help_key='help_clean_type'
 )
@@ -376,7 +448,19 @@ def clean(ctx, project_name, project_type, verbose, git, venv, python_version, i
     """Create a project with Clean Architecture."""
     validate_and_exit_on_error(project_name, git, venv, python_version, install_deps)
 
+    from prozes.modules.console import (
+        console,
+        print_error,
+        print_header,
+        print_next_steps,
+        print_step,
+    )
+    from prozes.modules.dirs import create_project_folder
+    from prozes.modules.fsbatch import FSBatch
+    from prozes.modules.structures import create_clean_structure
+
     # Check for updates before creating project
+    from prozes.modules.update_checker import check_and_prompt_update
     check_and_prompt_update(lang=ctx.obj.get('lang', 'en'))
 
     try:
@@ -386,9 +470,10 @@ def clean(ctx, project_name, project_type, verbose, git, venv, python_version, i
 
         project_path = create_project_folder(project_name, verbose=False)
         print_step(t('creating_folder_structure'))
-        create_clean_structure(project_path, full_type, auth, verbose)
+        batch = FSBatch(project_path)
+        create_clean_structure(project_path, full_type, auth, verbose, batch=batch)
 
-        options = finalize_project(project_path, project_name, full_type, verbose, git, venv, python_version, install_deps, auth)
+        options = finalize_project(project_path, project_name, full_type, verbose, git, venv, python_version, install_deps, auth, batch=batch)
 
         # Next steps
         steps = [f"cd {project_name}"]
@@ -409,6 +494,10 @@ def clean(ctx, project_name, project_type, verbose, git, venv, python_version, i
 # Template Commands
 # =============================================================================
 
+# Variables filled in by apply_template itself, never prompted for
+_BUILTIN_TEMPLATE_VARS = frozenset(('project_name', 'date', 'year'))
+
+
 @cli.group(cls=TranslatedGroup, help_key='help_template')
 def template():
     """Gerenciar templates customizados."""
@@ -425,6 +514,13 @@ def template():
 @click.option('-v', '--verbose', is_flag=True, cls=TranslatedOption, help_key='help_verbose')
 def template_save(source_path, template_name, description, author, exclude_pattern, detect_variables, verbose):
     """Save existing project as template."""
+    from prozes.modules.console import console, print_error, print_header, print_success
+    from prozes.modules.templates import (
+        create_template_from_directory,
+        template_exists,
+        validate_template_name,
+    )
+
     try:
         source = Path(source_path)
 
@@ -479,9 +575,12 @@ def template_save(source_path, template_name, description, author, exclude_patte
 @click.option('-v', '--verbose', is_flag=True, cls=TranslatedOption, help_key='help_verbose')
 def template_list(custom_only, verbose):
     """List all available templates."""
+    from prozes.modules.console import console, print_error, print_template_list
+    from prozes.modules.templates import iter_custom_templates
+
     try:
-        # Get custom templates
-        custom_templates = list_custom_templates()
+        # Custom templates are loaded lazily while they are printed
+        custom_templates = iter_custom_templates()
 
         # Get built-in templates info
         builtin_templates = None
@@ -506,6 +605,16 @@ def template_list(custom_only, verbose):
 @common_options
 def template_use(template_name, project_name, var, interactive, verbose, git, venv, python_version, install_deps, auth):
     """Create project from custom template."""
+    from prozes.modules.console import (
+        console,
+        print_error,
+        print_header,
+        print_info,
+        print_next_steps,
+    )
+    from prozes.modules.templates import apply_template, get_template
+    from prozes.modules.validation import validate_project_name
+
     try:
         # Validate project name
         is_valid, error = validate_project_name(project_name)
@@ -513,9 +622,14 @@ def template_use(template_name, project_name, var, interactive, verbose, git, ve
             print_error(error)
             sys.exit(1)
 
-        # Check if project already exists
-        project_path = Path.cwd() / project_name
-        if project_path.exists():
+        # Check if project already exists (a single lstat; the path is reused below)
+        destination = Path.cwd()
+        project_path = destination / project_name
+        try:
+            project_path.lstat()
+        except FileNotFoundError:
+            pass
+        else:
             print_error(f"Project '{project_name}' already exists in current directory")
             sys.exit(1)
 
@@ -530,33 +644,32 @@ def template_use(template_name, project_name, var, interactive, verbose, git, ve
         # Parse variables from --var options
         variables = {}
         for var_str in var:
-            if '=' not in var_str:
+            key, sep, value = var_str.partition('=')
+            if not sep:
                 print_error(f"Invalid variable format: {var_str} (expected KEY=VALUE)")
                 sys.exit(1)
 
-            key, value = var_str.split('=', 1)
             variables[key.strip()] = value.strip()
 
         # Interactive mode: prompt for missing variables
         if interactive or not variables:
-            from prozes.modules.console import print_variable_prompt
-
-            console.print("\n[bold cyan]Template Variables:[/bold cyan]")
+            # Skip variables already provided via --var and built-ins that are auto-filled
+            pending = [
+                (var_name, var_obj)
+                for var_name, var_obj in tpl.metadata.variables.items()
+                if var_name not in variables and var_name not in _BUILTIN_TEMPLATE_VARS
+            ]
 
-            for var_name, var_obj in tpl.metadata.variables.items():
-                # Skip if already provided via --var
-                if var_name in variables:
-                    continue
+            if pending:
+                from prozes.modules.console import print_variable_prompt
 
-                # Skip built-in variables that will be auto-filled
-                if var_name in ['project_name', 'date', 'year']:
-                    continue
+                console.print("\n[bold cyan]Template Variables:[/bold cyan]")
 
-                print_variable_prompt(var_obj)
-                value = var_obj.prompt_user()
-                variables[var_name] = value
+                for var_name, var_obj in pending:
+                    print_variable_prompt(var_obj)
+                    variables[var_name] = var_obj.prompt_user()
 
-            console.print()
+                console.print()
 
         # Apply template
         if verbose:
@@ -566,7 +679,9 @@ def template_use(template_name, project_name, var, interactive, verbose, git, ve
             template=tpl,
             project_name=project_name,
             variables=variables,
-            verbose=verbose
+            destination=destination,
+            verbose=verbose,
+            check_exists=False  # already lstat()ed above
         )
 
         # Finalize project (venv, git, deps)
@@ -602,13 +717,23 @@ def template_use(template_name, project_name, var, interactive, verbose, git, ve
 @click.option('--show-files', is_flag=True, help='Show file tree')
 def template_show(template_name, show_files):
     """Show template details."""
+    from prozes.modules.console import (
+        console,
+        print_error,
+        print_template_info,
+        print_template_tree,
+    )
+    from prozes.modules.templates import get_template
+
     try:
         tpl = get_template(template_name)
         if tpl is None:
             print_error(t('template_not_found', name=template_name))
             sys.exit(1)
 
-        print_template_info(tpl)
+        # One walk of the structure serves both the file count and the tree
+        files = tpl.get_file_tree()
+        print_template_info(tpl, files)
 
         # Show variables
         if tpl.metadata.variables:
@@ -622,7 +747,7 @@ def template_show(template_name, show_files):
 
         # Show file tree
         if show_files:
-            print_template_tree(tpl)
+            print_template_tree(tpl, files)
 
     except Exception as e:
         print_error(f"Error showing template: {e}")
@@ -635,6 +760,9 @@ def template_show(template_name, show_files):
 @click.option('-f', '--force', is_flag=True, help='Skip confirmation')
 def template_delete(template_name, force):
     """Delete custom template."""
+    from prozes.modules.console import console, print_error
+    from prozes.modules.templates import delete_template, get_template
+
     try:
         # Check if template exists
         tpl = get_template(template_name)
@@ -660,22 +788,20 @@ def template_delete(template_name, force):
 @cli.command(cls=TranslatedCommand, help_key='help_config')
 @click.option(
     '--lang', '-l',
-    type=click.Choice(['en', 'pt', 'es', 'it', 'fr'], case_sensitive=False),
+    type=_LANG_CHOICE,
     cls=TranslatedOption, help_key='help_config_lang'
 )
 @click.option('--show', '-s', is_flag=True,
               cls=TranslatedOption, help_key='help_config_show')
 def config(lang, show):
     """Configure Prozes settings."""
-    from pathlib import Path
-    import os
+    from prozes.modules.console import console, print_success
+    from prozes.modules.i18n import invalidate_config_cache
 
-    config_dir = Path.home() / '.prozes'
-    config_file = config_dir / 'config'
+    config_dir = _PROZES_HOME
+    config_file = _CONFIG_FILE
 
     if show:
-        from prozes.modules.i18n import get_language
-
         console.print(f"\n[bold cyan]Prozes Configuration[/bold cyan]")
         console.print(f"  Config file: [dim]{config_file}[/dim]")
 
@@ -700,6 +826,7 @@ def config(lang, show):
 
         # Write config
         config_file.write_text(f"lang={lang}\n")
+        invalidate_config_cache()
 
         print_success(f"Language set to '{lang}'")
         console.print(f"  Config saved to: [dim]{config_file}[/dim]")
@@ -1,23 +1,32 @@
 """Modulos auxiliares do Prozees."""
 
-from prozes.modules.venv import criar_venv, instalar_dependencias
-from prozes.modules.dirs import create_project_folder, command_git
-from prozes.modules.install import create_default_requirements
-from prozes.modules.structures import (
-    create_mvc_structure,
-    create_api_structure,
-    create_cli_structure,
-    create_clean_structure,
-)
+import importlib
 
-__all__ = [
-    'criar_venv',
-    'instalar_dependencias',
-    'create_project_folder',
-    'command_git',
-    'create_default_requirements',
-    'create_mvc_structure',
-    'create_api_structure',
-    'create_cli_structure',
-    'create_clean_structure',
-]
+# Os submodulos so sao importados no primeiro acesso (PEP 562), assim
+# `prozes --help` nao paga o custo de carregar rich, templates, etc.
+_LAZY_EXPORTS = {
+    'criar_venv': 'prozes.modules.venv',
+    'instalar_dependencias': 'prozes.modules.venv',
+    'create_project_folder': 'prozes.modules.dirs',
+    'command_git': 'prozes.modules.dirs',
+    'create_default_requirements': 'prozes.modules.install',
+    'create_mvc_structure': 'prozes.modules.structures',
+    'create_api_structure': 'prozes.modules.structures',
+    'create_cli_structure': 'prozes.modules.structures',
+    'create_clean_structure': 'prozes.modules.structures',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,141 @@
+"""English strings for Prozes (loaded on demand by prozes.modules.i18n)."""
+
+STRINGS = {
+    # Headers
+    'creating_project_mvc': 'Creating MVC project',
+    'creating_project_api': 'Creating REST API',
+    'creating_project_cli': 'Creating CLI project',
+    'creating_project_clean': 'Creating Clean Architecture project',
+
+    # Steps
+    'creating_folder_structure': 'Creating folder structure...',
+    'creating_venv': 'Creating virtual environment...',
+    'installing_deps': 'Installing dependencies...',
+    'initializing_git': 'Initializing Git repository...',
+
+    # Success messages
+    'venv_created': 'Virtual environment created',
+    'deps_installed': 'Dependencies installed',
+    'git_initialized': 'Git repository initialized',
+    'structure_mvc_created': 'MVC structure created',
+    'structure_api_created': 'REST API structure created',
+    'structure_cli_created': 'CLI structure created',
+    'structure_clean_created': 'Clean Architecture structure created',
+    'requirements_created': 'requirements.txt created',
+    'project_created': 'Project created successfully!',
+
+    # Error messages
+    'error_creating_project': 'Error creating project',
+    'venv_already_exists': 'Virtual environment already exists',
+    'venv_not_found': 'Virtual environment not found',
+    'python_not_found': 'Python version {version} not found',
+    'requirements_not_found': 'Requirements file not found',
+    'git_not_found': 'Git not found. Make sure Git is installed.',
+
+    # Validation messages
+    'validation_name_empty': 'Project name cannot be empty',
+    'validation_name_start': 'Project name must start with a letter or underscore',
+    'validation_name_chars': 'Project name can only contain letters, numbers, and underscores',
+    'validation_name_keyword': "'{name}' is a Python reserved keyword",
+    'validation_project_exists': "Project '{name}' already exists in the current directory",
+    'validation_python_version_format': "Invalid Python version format: '{version}'. Use format like 3.8 or 3.11",
+    'validation_git_not_available': 'Git is not installed or not available in PATH',
+    'validation_install_deps_requires_venv': '--install-deps requires --venv to be specified',
+    'validation_errors_header': 'Validation errors',
+
+    # Summary table
+    'project': 'Project',
+    'type': 'Type',
+    'venv': 'Venv',
+    'git': 'Git',
+    'deps': 'Deps',
+    'created': 'Created',
+    'initialized': 'Initialized',
+    'installed': 'Installed',
+
+    # Next steps
+    'next_steps': 'Next steps',
+    'activate_venv_win': '(Windows)',
+    'activate_venv_unix': '(Linux/Mac)',
+    'open_docs': 'Open',
+
+    # CLI Help texts
+    'help_main': 'Prozes - Python project generator with predefined architectures.\n\nAll commands support: --venv, --git, --auth, --install-deps, --python-version, -v/--verbose',
+    'help_lang': 'Language (en=English, pt=Portuguese). Uses global config if not specified.',
+    'help_verbose': 'Verbose mode',
+    'help_git': 'Initialize Git repository',
+    'help_venv': 'Create virtual environment',
+    'help_python_version': 'Python version for venv (e.g., 3.11)',
+    'help_install_deps': 'Install dependencies automatically',
+    'help_auth': 'Authentication type (default: none)',
+
+    # Auth types
+    'auth_jwt': 'JWT token-based authentication',
+    'auth_oauth2': 'OAuth2 third-party authentication',
+    'auth_session': 'Session-based authentication',
+    'auth_basic': 'HTTP Basic authentication',
+
+    # Auth messages
+    'auth_configured': 'Authentication configured',
+    'auth_warning_database': 'Note: Using in-memory storage. For production, replace with a real database.',
+
+    'help_mvc': 'Create a project with MVC architecture.',
+    'help_mvc_long': 'Structure with Models, Views, Controllers, templates and static files.',
+    'help_mvc_type': 'Project type (default: web-flask)',
+
+    'help_api': 'Create a pure REST API (no frontend).',
+    'help_api_long': 'Lean structure focused on REST endpoints.',
+    'help_api_type': 'API framework (default: fastapi)',
+
+    'help_cli': 'Create a CLI project with Click.',
+    'help_cli_long': 'Structure for command-line applications.',
+
+    'help_clean': 'Create a project with Clean Architecture.',
+    'help_clean_long': '''Structure:
+  src/entities/     - Domain entities
+  src/use_cases/    - Use cases (business rules)
+  src/adapters/     - Repositories, Presenters
+  src/frameworks/   - External frameworks (web, db)''',
+    'help_clean_type': 'Web framework (default: flask)',
+
+    'help_config': 'Configure Prozes settings.',
+    'help_config_lang': 'Set default language (en=English, pt=Portuguese)',
+    'help_config_show': 'Show current configuration',
+
+    # Template commands
+    'help_template': 'Manage custom templates',
+    'help_template_save': 'Save existing project as template',
+    'help_template_list': 'List all available templates',
+    'help_template_use': 'Create project from custom template',
+    'help_template_show': 'Show template details',
+    'help_template_delete': 'Delete custom template',
+
+    # Template messages
+    'template_saved': 'Template saved successfully',
+    'template_not_found': "Template '{name}' not found",
+    'scanning_project': 'Scanning project structure...',
+    'detecting_variables': 'Detecting variables...',
+    'copying_files': 'Copying files...',
+    'substituting_variables': 'Substituting variables...',
+    'template_exists': "Template '{name}' already exists",
+    'confirm_overwrite': 'Overwrite existing template?',
+    'template_deleted': 'Template deleted successfully',
+    'custom_templates': 'Custom Templates',
+    'builtin_templates': 'Built-in Templates',
+    'no_custom_templates': 'No custom templates found',
+    'template_details': 'Template Details',
+    'template_name': 'Name',
+    'template_description': 'Description',
+    'template_author': 'Author',
+    'template_created': 'Created',
+    'template_location': 'Location',
+    'template_variables': 'Variables',
+    'template_files': 'Files',
+
+    # Template errors
+    'error_invalid_template': 'Invalid template structure',
+    'error_source_not_found': 'Source directory not found',
+    'error_template_validation': 'Template validation failed',
+    'error_template_exists': "Template '{name}' already exists",
+    'error_template_name_invalid': 'Invalid template name',
+}
@@ -0,0 +1,141 @@
+"""Spanish strings for Prozes (loaded on demand by prozes.modules.i18n)."""
+
+STRINGS = {
+    # Headers
+    'creating_project_mvc': 'Creando proyecto MVC',
+    'creating_project_api': 'Creando API REST',
+    'creating_project_cli': 'Creando proyecto CLI',
+    'creating_project_clean': 'Creando proyecto Clean Architecture',
+
+    # Steps
+    'creating_folder_structure': 'Creando estructura de carpetas...',
+    'creating_venv': 'Creando entorno virtual...',
+    'installing_deps': 'Instalando dependencias...',
+    'initializing_git': 'Inicializando repositorio Git...',
+
+    # Success messages
+    'venv_created': 'Entorno virtual creado',
+    'deps_installed': 'Dependencias instaladas',
+    'git_initialized': 'Repositorio Git inicializado',
+    'structure_mvc_created': 'Estructura MVC creada',
+    'structure_api_created': 'Estructura API REST creada',
+    'structure_cli_created': 'Estructura CLI creada',
+    'structure_clean_created': 'Estructura Clean Architecture creada',
+    'requirements_created': 'requirements.txt creado',
+    'project_created': '¡Proyecto creado con éxito!',
+
+    # Error messages
+    'error_creating_project': 'Error al crear proyecto',
+    'venv_already_exists': 'El entorno virtual ya existe',
+    'venv_not_found': 'Entorno virtual no encontrado',
+    'python_not_found': 'Python versión {version} no encontrado',
+    'requirements_not_found': 'Archivo de requirements no encontrado',
+    'git_not_found': 'Git no encontrado. Asegúrate de que Git esté instalado.',
+
+    # Validation messages
+    'validation_name_empty': 'El nombre del proyecto no puede estar vacío',
+    'validation_name_start': 'El nombre del proyecto debe comenzar con una letra o guion bajo',
+    'validation_name_chars': 'El nombre del proyecto solo puede contener letras, números y guiones bajos',
+    'validation_name_keyword': "'{name}' es una palabra reservada de Python",
+    'validation_project_exists': "El proyecto '{name}' ya existe en el directorio actual",
+    'validation_python_version_format': "Formato de versión de Python inválido: '{version}'. Use formato como 3.8 o 3.11",
+    'validation_git_not_available': 'Git no está instalado o no está disponible en PATH',
+    'validation_install_deps_requires_venv': '--install-deps requiere que se especifique --venv',
+    'validation_errors_header': 'Errores de validación',
+
+    # Summary table
+    'project': 'Proyecto',
+    'type': 'Tipo',
+    'venv': 'Venv',
+    'git': 'Git',
+    'deps': 'Deps',
+    'created': 'Creado',
+    'initialized': 'Inicializado',
+    'installed': 'Instalado',
+
+    # Next steps
+    'next_steps': 'Próximos pasos',
+    'activate_venv_win': '(Windows)',
+    'activate_venv_unix': '(Linux/Mac)',
+    'open_docs': 'Abrir',
+
+    # CLI Help texts
+    'help_main': 'Prozes - Generador de proyectos Python con arquitecturas predefinidas.\n\nTodos los comandos soportan: --venv, --git, --auth, --install-deps, --python-version, -v/--verbose',
+    'help_lang': 'Idioma (en=Inglés, pt=Portugués, es=Español, it=Italiano, fr=Francés). Usa config global si no se especifica.',
+    'help_verbose': 'Modo detallado',
+    'help_git': 'Inicializar repositorio Git',
+    'help_venv': 'Crear entorno virtual',
+    'help_python_version': 'Versión de Python para venv (ej: 3.11)',
+    'help_install_deps': 'Instalar dependencias automáticamente',
+    'help_auth': 'Tipo de autenticación (predeterminado: none)',
+
+    # Auth types
+    'auth_jwt': 'Autenticación basada en tokens JWT',
+    'auth_oauth2': 'Autenticación OAuth2 con terceros',
+    'auth_session': 'Autenticación basada en sesión',
+    'auth_basic': 'Autenticación HTTP Basic',
+
+    # Auth messages
+    'auth_configured': 'Autenticación configurada',
+    'auth_warning_database': 'Nota: Usando almacenamiento en memoria. Para producción, reemplaza con una base de datos real.',
+
+    'help_mvc': 'Crear proyecto con arquitectura MVC.',
+    'help_mvc_long': 'Estructura con Models, Views, Controllers, templates y archivos estáticos.',
+    'help_mvc_type': 'Tipo de proyecto (predeterminado: web-flask)',
+
+    'help_api': 'Crear una API REST pura (sin frontend).',
+    'help_api_long': 'Estructura limpia enfocada en endpoints REST.',
+    'help_api_type': 'Framework de API (predeterminado: fastapi)',
+
+    'help_cli': 'Crear proyecto CLI con Click.',
+    'help_cli_long': 'Estructura para aplicaciones de línea de comandos.',
+
+    'help_clean': 'Crear proyecto con Clean Architecture.',
+    'help_clean_long': '''Estructura:
+  src/entities/     - Entidades del dominio
+  src/use_cases/    - Casos de uso (reglas de negocio)
+  src/adapters/     - Repositorios, Presentadores
+  src/frameworks/   - Frameworks externos (web, db)''',
+    'help_clean_type': 'Framework web (predeterminado: flask)',
+
+    'help_config': 'Configurar opciones de Prozes.',
+    'help_config_lang': 'Definir idioma predeterminado (en=Inglés, pt=Portugués, es=Español, it=Italiano, fr=Francés)',
+    'help_config_show': 'Mostrar configuración actual',
+
+    # Template commands
+    'help_template': 'Gestionar templates personalizados',
+    'help_template_save': 'Guardar proyecto existente como template',
+    'help_template_list': 'Listar todos los templates disponibles',
+    'help_template_use': 'Crear proyecto a partir de template personalizado',
+    'help_template_show': 'Mostrar detalles del template',
+    'help_template_delete': 'Eliminar template personalizado',
+
+    # Template messages
+    'template_saved': 'Template guardado con éxito',
+    'template_not_found': "Template '{name}' no encontrado",
+    'scanning_project': 'Escaneando estructura del proyecto...',
+    'detecting_variables': 'Detectando variables...',
+    'copying_files': 'Copiando archivos...',
+    'substituting_variables': 'Sustituyendo variables...',
+    'template_exists': "El template '{name}' ya existe",
+    'confirm_overwrite': '¿Sobrescribir template existente?',
+    'template_deleted': 'Template eliminado con éxito',
+    'custom_templates': 'Templates Personalizados',
+    'builtin_templates': 'Templates Integrados',
+    'no_custom_templates': 'No se encontraron templates personalizados',
+    'template_details': 'Detalles del Template',
+    'template_name': 'Nombre',
+    'template_description': 'Descripción',
+    'template_author': 'Autor',
+    'template_created': 'Creado',
+    'template_location': 'Ubicación',
+    'template_variables': 'Variables',
+    'template_files': 'Archivos',
+
+    # Template errors
+    'error_invalid_template': 'Estructura de template inválida',
+    'error_source_not_found': 'Directorio fuente no encontrado',
+    'error_template_validation': 'Validación de template falló',
+    'error_template_exists': "El template '{name}' ya existe",
+    'error_template_name_invalid': 'Nombre de template inválido',
+}
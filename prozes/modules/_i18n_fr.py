@@ -0,0 +1,141 @@
+"""French strings for Prozes (loaded on demand by prozes.modules.i18n)."""
+
+STRINGS = {
+    # Headers
+    'creating_project_mvc': 'Création du projet MVC',
+    'creating_project_api': 'Création de l\'API REST',
+    'creating_project_cli': 'Création du projet CLI',
+    'creating_project_clean': 'Création du projet Clean Architecture',
+
+    # Steps
+    'creating_folder_structure': 'Création de la structure de dossiers...',
+    'creating_venv': 'Création de l\'environnement virtuel...',
+    'installing_deps': 'Installation des dépendances...',
+    'initializing_git': 'Initialisation du dépôt Git...',
+
+    # Success messages
+    'venv_created': 'Environnement virtuel créé',
+    'deps_installed': 'Dépendances installées',
+    'git_initialized': 'Dépôt Git initialisé',
+    'structure_mvc_created': 'Structure MVC créée',
+    'structure_api_created': 'Structure API REST créée',
+    'structure_cli_created': 'Structure CLI créée',
+    'structure_clean_created': 'Structure Clean Architecture créée',
+    'requirements_created': 'requirements.txt créé',
+    'project_created': 'Projet créé avec succès !',
+
+    # Error messages
+    'error_creating_project': 'Erreur lors de la création du projet',
+    'venv_already_exists': 'L\'environnement virtuel existe déjà',
+    'venv_not_found': 'Environnement virtuel non trouvé',
+    'python_not_found': 'Python version {version} non trouvé',
+    'requirements_not_found': 'Fichier requirements non trouvé',
+    'git_not_found': 'Git non trouvé. Assurez-vous que Git est installé.',
+
+    # Validation messages
+    'validation_name_empty': 'Le nom du projet ne peut pas être vide',
+    'validation_name_start': 'Le nom du projet doit commencer par une lettre ou un underscore',
+    'validation_name_chars': 'Le nom du projet ne peut contenir que des lettres, des chiffres et des underscores',
+    'validation_name_keyword': "'{name}' est un mot-clé réservé de Python",
+    'validation_project_exists': "Le projet '{name}' existe déjà dans le répertoire actuel",
+    'validation_python_version_format': "Format de version Python invalide : '{version}'. Utilisez un format comme 3.8 ou 3.11",
+    'validation_git_not_available': 'Git n\'est pas installé ou n\'est pas disponible dans PATH',
+    'validation_install_deps_requires_venv': '--install-deps nécessite que --venv soit spécifié',
+    'validation_errors_header': 'Erreurs de validation',
+
+    # Summary table
+    'project': 'Projet',
+    'type': 'Type',
+    'venv': 'Venv',
+    'git': 'Git',
+    'deps': 'Deps',
+    'created': 'Créé',
+    'initialized': 'Initialisé',
+    'installed': 'Installé',
+
+    # Next steps
+    'next_steps': 'Prochaines étapes',
+    'activate_venv_win': '(Windows)',
+    'activate_venv_unix': '(Linux/Mac)',
+    'open_docs': 'Ouvrir',
+
+    # CLI Help texts
+    'help_main': 'Prozes - Générateur de projets Python avec architectures prédéfinies.\n\nToutes les commandes supportent : --venv, --git, --auth, --install-deps, --python-version, -v/--verbose',
+    'help_lang': 'Langue (en=Anglais, pt=Portugais, es=Espagnol, it=Italien, fr=Français). Utilise config globale si non spécifié.',
+    'help_verbose': 'Mode détaillé',
+    'help_git': 'Initialiser le dépôt Git',
+    'help_venv': 'Créer un environnement virtuel',
+    'help_python_version': 'Version Python pour venv (ex : 3.11)',
+    'help_install_deps': 'Installer les dépendances automatiquement',
+    'help_auth': 'Type d\'authentification (par défaut : none)',
+
+    # Auth types
+    'auth_jwt': 'Authentification basée sur tokens JWT',
+    'auth_oauth2': 'Authentification OAuth2 avec tiers',
+    'auth_session': 'Authentification basée sur session',
+    'auth_basic': 'Authentification HTTP Basic',
+
+    # Auth messages
+    'auth_configured': 'Authentification configurée',
+    'auth_warning_database': 'Note : Utilisation du stockage en mémoire. Pour la production, remplacez par une vraie base de données.',
+
+    'help_mvc': 'Créer un projet avec architecture MVC.',
+    'help_mvc_long': 'Structure avec Models, Views, Controllers, templates et fichiers statiques.',
+    'help_mvc_type': 'Type de projet (par défaut : web-flask)',
+
+    'help_api': 'Créer une API REST pure (sans frontend).',
+    'help_api_long': 'Structure légère axée sur les endpoints REST.',
+    'help_api_type': 'Framework API (par défaut : fastapi)',
+
+    'help_cli': 'Créer un projet CLI avec Click.',
+    'help_cli_long': 'Structure pour applications en ligne de commande.',
+
+    'help_clean': 'Créer un projet avec Clean Architecture.',
+    'help_clean_long': '''Structure :
+  src/entities/     - Entités du domaine
+  src/use_cases/    - Cas d\'usage (règles métier)
+  src/adapters/     - Dépôts, Présentateurs
+  src/frameworks/   - Frameworks externes (web, db)''',
+    'help_clean_type': 'Framework web (par défaut : flask)',
+
+    'help_config': 'Configurer les options de Prozes.',
+    'help_config_lang': 'Définir la langue par défaut (en=Anglais, pt=Portugais, es=Espagnol, it=Italien, fr=Français)',
+    'help_config_show': 'Afficher la configuration actuelle',
+
+    # Template commands
+    'help_template': 'Gérer les templates personnalisés',
+    'help_template_save': 'Enregistrer un projet existant comme template',
+    'help_template_list': 'Lister tous les templates disponibles',
+    'help_template_use': 'Créer un projet à partir d\'un template personnalisé',
+    'help_template_show': 'Afficher les détails du template',
+    'help_template_delete': 'Supprimer un template personnalisé',
+
+    # Template messages
+    'template_saved': 'Template enregistré avec succès',
+    'template_not_found': "Template '{name}' non trouvé",
+    'scanning_project': 'Analyse de la structure du projet...',
+    'detecting_variables': 'Détection des variables...',
+    'copying_files': 'Copie des fichiers...',
+    'substituting_variables': 'Substitution des variables...',
+    'template_exists': "Le template '{name}' existe déjà",
+    'confirm_overwrite': 'Écraser le template existant ?',
+    'template_deleted': 'Template supprimé avec succès',
+    'custom_templates': 'Templates Personnalisés',
+    'builtin_templates': 'Templates Intégrés',
+    'no_custom_templates': 'Aucun template personnalisé trouvé',
+    'template_details': 'Détails du Template',
+    'template_name': 'Nom',
+    'template_description': 'Description',
+    'template_author': 'Auteur',
+    'template_created': 'Créé',
+    'template_location': 'Emplacement',
+    'template_variables': 'Variables',
+    'template_files': 'Fichiers',
+
+    # Template errors
+    'error_invalid_template': 'Structure de template invalide',
+    'error_source_not_found': 'Répertoire source non trouvé',
+    'error_template_validation': 'Validation du template échouée',
+    'error_template_exists': "Le template '{name}' existe déjà",
+    'error_template_name_invalid': 'Nom de template invalide',
+}
@@ -0,0 +1,141 @@
+"""Italian strings for Prozes (loaded on demand by prozes.modules.i18n)."""
+
+STRINGS = {
+    # Headers
+    'creating_project_mvc': 'Creazione progetto MVC',
+    'creating_project_api': 'Creazione API REST',
+    'creating_project_cli': 'Creazione progetto CLI',
+    'creating_project_clean': 'Creazione progetto Clean Architecture',
+
+    # Steps
+    'creating_folder_structure': 'Creazione struttura cartelle...',
+    'creating_venv': 'Creazione ambiente virtuale...',
+    'installing_deps': 'Installazione dipendenze...',
+    'initializing_git': 'Inizializzazione repository Git...',
+
+    # Success messages
+    'venv_created': 'Ambiente virtuale creato',
+    'deps_installed': 'Dipendenze installate',
+    'git_initialized': 'Repository Git inizializzato',
+    'structure_mvc_created': 'Struttura MVC creata',
+    'structure_api_created': 'Struttura API REST creata',
+    'structure_cli_created': 'Struttura CLI creata',
+    'structure_clean_created': 'Struttura Clean Architecture creata',
+    'requirements_created': 'requirements.txt creato',
+    'project_created': 'Progetto creato con successo!',
+
+    # Error messages
+    'error_creating_project': 'Errore durante la creazione del progetto',
+    'venv_already_exists': "L'ambiente virtuale esiste già",
+    'venv_not_found': 'Ambiente virtuale non trovato',
+    'python_not_found': 'Python versione {version} non trovato',
+    'requirements_not_found': 'File requirements non trovato',
+    'git_not_found': 'Git non trovato. Assicurati che Git sia installato.',
+
+    # Validation messages
+    'validation_name_empty': 'Il nome del progetto non può essere vuoto',
+    'validation_name_start': 'Il nome del progetto deve iniziare con una lettera o underscore',
+    'validation_name_chars': 'Il nome del progetto può contenere solo lettere, numeri e underscore',
+    'validation_name_keyword': "'{name}' è una parola riservata di Python",
+    'validation_project_exists': "Il progetto '{name}' esiste già nella directory corrente",
+    'validation_python_version_format': "Formato versione Python non valido: '{version}'. Usa formato come 3.8 o 3.11",
+    'validation_git_not_available': 'Git non è installato o non è disponibile in PATH',
+    'validation_install_deps_requires_venv': '--install-deps richiede che sia specificato --venv',
+    'validation_errors_header': 'Errori di validazione',
+
+    # Summary table
+    'project': 'Progetto',
+    'type': 'Tipo',
+    'venv': 'Venv',
+    'git': 'Git',
+    'deps': 'Deps',
+    'created': 'Creato',
+    'initialized': 'Inizializzato',
+    'installed': 'Installato',
+
+    # Next steps
+    'next_steps': 'Prossimi passi',
+    'activate_venv_win': '(Windows)',
+    'activate_venv_unix': '(Linux/Mac)',
+    'open_docs': 'Apri',
+
+    # CLI Help texts
+    'help_main': 'Prozes - Generatore di progetti Python con architetture predefinite.\n\nTutti i comandi supportano: --venv, --git, --auth, --install-deps, --python-version, -v/--verbose',
+    'help_lang': 'Lingua (en=Inglese, pt=Portoghese, es=Spagnolo, it=Italiano, fr=Francese). Usa config globale se non specificato.',
+    'help_verbose': 'Modalità dettagliata',
+    'help_git': 'Inizializza repository Git',
+    'help_venv': 'Crea ambiente virtuale',
+    'help_python_version': 'Versione Python per venv (es: 3.11)',
+    'help_install_deps': 'Installa dipendenze automaticamente',
+    'help_auth': 'Tipo di autenticazione (predefinito: none)',
+
+    # Auth types
+    'auth_jwt': 'Autenticazione basata su token JWT',
+    'auth_oauth2': 'Autenticazione OAuth2 con terze parti',
+    'auth_session': 'Autenticazione basata su sessione',
+    'auth_basic': 'Autenticazione HTTP Basic',
+
+    # Auth messages
+    'auth_configured': 'Autenticazione configurata',
+    'auth_warning_database': 'Nota: Utilizzo di storage in memoria. Per produzione, sostituisci con un database reale.',
+
+    'help_mvc': 'Crea progetto con architettura MVC.',
+    'help_mvc_long': 'Struttura con Models, Views, Controllers, template e file statici.',
+    'help_mvc_type': 'Tipo di progetto (predefinito: web-flask)',
+
+    'help_api': 'Crea una API REST pura (senza frontend).',
+    'help_api_long': 'Struttura snella focalizzata su endpoint REST.',
+    'help_api_type': 'Framework API (predefinito: fastapi)',
+
+    'help_cli': 'Crea progetto CLI con Click.',
+    'help_cli_long': 'Struttura per applicazioni da riga di comando.',
+
+    'help_clean': 'Crea progetto con Clean Architecture.',
+    'help_clean_long': '''Struttura:
+  src/entities/     - Entità del dominio
+  src/use_cases/    - Casi d\'uso (regole di business)
+  src/adapters/     - Repository, Presenter
+  src/frameworks/   - Framework esterni (web, db)''',
+    'help_clean_type': 'Framework web (predefinito: flask)',
+
+    'help_config': 'Configura opzioni di Prozes.',
+    'help_config_lang': 'Imposta lingua predefinita (en=Inglese, pt=Portoghese, es=Spagnolo, it=Italiano, fr=Francese)',
+    'help_config_show': 'Mostra configurazione corrente',
+
+    # Template commands
+    'help_template': 'Gestisci template personalizzati',
+    'help_template_save': 'Salva progetto esistente come template',
+    'help_template_list': 'Elenca tutti i template disponibili',
+    'help_template_use': 'Crea progetto da template personalizzato',
+    'help_template_show': 'Mostra dettagli template',
+    'help_template_delete': 'Elimina template personalizzato',
+
+    # Template messages
+    'template_saved': 'Template salvato con successo',
+    'template_not_found': "Template '{name}' non trovato",
+    'scanning_project': 'Scansione struttura progetto...',
+    'detecting_variables': 'Rilevamento variabili...',
+    'copying_files': 'Copia file...',
+    'substituting_variables': 'Sostituzione variabili...',
+    'template_exists': "Il template '{name}' esiste già",
+    'confirm_overwrite': 'Sovrascrivere template esistente?',
+    'template_deleted': 'Template eliminato con successo',
+    'custom_templates': 'Template Personalizzati',
+    'builtin_templates': 'Template Integrati',
+    'no_custom_templates': 'Nessun template personalizzato trovato',
+    'template_details': 'Dettagli Template',
+    'template_name': 'Nome',
+    'template_description': 'Descrizione',
+    'template_author': 'Autore',
+    'template_created': 'Creato',
+    'template_location': 'Posizione',
+    'template_variables': 'Variabili',
+    'template_files': 'File',
+
+    # Template errors
+    'error_invalid_template': 'Struttura template non valida',
+    'error_source_not_found': 'Directory sorgente non trovata',
+    'error_template_validation': 'Validazione template fallita',
+    'error_template_exists': "Il template '{name}' esiste già",
+    'error_template_name_invalid': 'Nome template non valido',
+}
@@ -0,0 +1,141 @@
+"""Portuguese strings for Prozes (loaded on demand by prozes.modules.i18n)."""
+
+STRINGS = {
+    # Headers
+    'creating_project_mvc': 'Criando projeto MVC',
+    'creating_project_api': 'Criando API REST',
+    'creating_project_cli': 'Criando projeto CLI',
+    'creating_project_clean': 'Criando projeto Clean Architecture',
+
+    # Steps
+    'creating_folder_structure': 'Criando estrutura de pastas...',
+    'creating_venv': 'Criando ambiente virtual...',
+    'installing_deps': 'Instalando dependencias...',
+    'initializing_git': 'Inicializando repositorio Git...',
+
+    # Success messages
+    'venv_created': 'Ambiente virtual criado',
+    'deps_installed': 'Dependencias instaladas',
+    'git_initialized': 'Repositorio Git inicializado',
+    'structure_mvc_created': 'Estrutura MVC criada',
+    'structure_api_created': 'Estrutura API REST criada',
+    'structure_cli_created': 'Estrutura CLI criada',
+    'structure_clean_created': 'Estrutura Clean Architecture criada',
+    'requirements_created': 'requirements.txt criado',
+    'project_created': 'Projeto criado com sucesso!',
+
+    # Error messages
+    'error_creating_project': 'Erro ao criar projeto',
+    'venv_already_exists': 'Ambiente virtual ja existe',
+    'venv_not_found': 'Ambiente virtual nao encontrado',
+    'python_not_found': 'Python versao {version} nao encontrado',
+    'requirements_not_found': 'Arquivo de requirements nao encontrado',
+    'git_not_found': 'Git nao encontrado. Certifique-se de que o Git esta instalado.',
+
+    # Validation messages
+    'validation_name_empty': 'Nome do projeto nao pode ser vazio',
+    'validation_name_start': 'Nome do projeto deve comecar com uma letra ou underscore',
+    'validation_name_chars': 'Nome do projeto pode conter apenas letras, numeros e underscores',
+    'validation_name_keyword': "'{name}' e uma palavra reservada do Python",
+    'validation_project_exists': "Projeto '{name}' ja existe no diretorio atual",
+    'validation_python_version_format': "Formato de versao Python invalido: '{version}'. Use formato como 3.8 ou 3.11",
+    'validation_git_not_available': 'Git nao esta instalado ou nao esta disponivel no PATH',
+    'validation_install_deps_requires_venv': '--install-deps requer que --venv seja especificado',
+    'validation_errors_header': 'Erros de validacao',
+
+    # Summary table
+    'project': 'Projeto',
+    'type': 'Tipo',
+    'venv': 'Venv',
+    'git': 'Git',
+    'deps': 'Deps',
+    'created': 'Criado',
+    'initialized': 'Inicializado',
+    'installed': 'Instalado',
+
+    # Next steps
+    'next_steps': 'Proximos passos',
+    'activate_venv_win': '(Windows)',
+    'activate_venv_unix': '(Linux/Mac)',
+    'open_docs': 'Abrir',
+
+    # CLI Help texts
+    'help_main': 'Prozes - Gerador de projetos Python com arquiteturas predefinidas.\n\nTodos os comandos suportam: --venv, --git, --auth, --install-deps, --python-version, -v/--verbose',
+    'help_lang': 'Idioma (en=Ingles, pt=Portugues). Usa config global se nao especificado.',
+    'help_verbose': 'Modo detalhado',
+    'help_git': 'Inicializar repositorio Git',
+    'help_venv': 'Criar ambiente virtual',
+    'help_python_version': 'Versao do Python para venv (ex: 3.11)',
+    'help_install_deps': 'Instalar dependencias automaticamente',
+    'help_auth': 'Tipo de autenticacao (padrao: none)',
+
+    # Auth types
+    'auth_jwt': 'Autenticacao baseada em tokens JWT',
+    'auth_oauth2': 'Autenticacao OAuth2 com terceiros',
+    'auth_session': 'Autenticacao baseada em sessao',
+    'auth_basic': 'Autenticacao HTTP Basic',
+
+    # Auth messages
+    'auth_configured': 'Autenticacao configurada',
+    'auth_warning_database': 'Nota: Usando armazenamento em memoria. Para producao, substitua por um banco de dados real.',
+
+    'help_mvc': 'Criar projeto com arquitetura MVC.',
+    'help_mvc_long': 'Estrutura com Models, Views, Controllers, templates e arquivos estaticos.',
+    'help_mvc_type': 'Tipo do projeto (padrao: web-flask)',
+
+    'help_api': 'Criar uma API REST pura (sem frontend).',
+    'help_api_long': 'Estrutura enxuta focada em endpoints REST.',
+    'help_api_type': 'Framework da API (padrao: fastapi)',
+
+    'help_cli': 'Criar projeto CLI com Click.',
+    'help_cli_long': 'Estrutura para aplicacoes de linha de comando.',
+
+    'help_clean': 'Criar projeto com Clean Architecture.',
+    'help_clean_long': '''Estrutura:
+  src/entities/     - Entidades do dominio
+  src/use_cases/    - Casos de uso (regras de negocio)
+  src/adapters/     - Repositorios, Presenters
+  src/frameworks/   - Frameworks externos (web, db)''',
+    'help_clean_type': 'Framework web (padrao: flask)',
+
+    'help_config': 'Configurar opcoes do Prozes.',
+    'help_config_lang': 'Definir idioma padrao (en=Ingles, pt=Portugues)',
+    'help_config_show': 'Mostrar configuracao atual',
+
+    # Template commands
+    'help_template': 'Gerenciar templates customizados',
+    'help_template_save': 'Salvar projeto existente como template',
+    'help_template_list': 'Listar todos os templates disponiveis',
+    'help_template_use': 'Criar projeto a partir de template customizado',
+    'help_template_show': 'Mostrar detalhes do template',
+    'help_template_delete': 'Deletar template customizado',
+
+    # Template messages
+    'template_saved': 'Template salvo com sucesso',
+    'template_not_found': "Template '{name}' nao encontrado",
+    'scanning_project': 'Escaneando estrutura do projeto...',
+    'detecting_variables': 'Detectando variaveis...',
+    'copying_files': 'Copiando arquivos...',
+    'substituting_variables': 'Substituindo variaveis...',
+    'template_exists': "Template '{name}' ja existe",
+    'confirm_overwrite': 'Sobrescrever template existente?',
+    'template_deleted': 'Template deletado com sucesso',
+    'custom_templates': 'Templates Customizados',
+    'builtin_templates': 'Templates Built-in',
+    'no_custom_templates': 'Nenhum template customizado encontrado',
+    'template_details': 'Detalhes do Template',
+    'template_name': 'Nome',
+    'template_description': 'Descricao',
+    'template_author': 'Autor',
+    'template_created': 'Criado',
+    'template_location': 'Localizacao',
+    'template_variables': 'Variaveis',
+    'template_files': 'Arquivos',
+
+    # Template errors
+    'error_invalid_template': 'Estrutura de template invalida',
+    'error_source_not_found': 'Diretorio fonte nao encontrado',
+    'error_template_validation': 'Validacao de template falhou',
+    'error_template_exists': "Template '{name}' ja existe",
+    'error_template_name_invalid': 'Nome de template invalido',
+}
@@ -1,10 +1,13 @@
 """Funções de output colorido pro terminal."""
 
 import sys
-from rich.console import Console
+from typing import Iterable, List
+
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
+from rich.tree import Tree
 from rich import box
 
 from prozes.modules.i18n import t
@@ -15,8 +18,12 @@ console = Console()
 
 def _supports_emoji():
     """Verifica se o terminal aguenta emojis."""
+    encoding = (sys.stdout.encoding or 'utf-8').lower().replace('_', '-')
+    # UTF-8/16/32 codificam qualquer emoji: nem precisa testar
+    if encoding.startswith('utf'):
+        return True
     try:
-        "\U0001f680".encode(sys.stdout.encoding or 'utf-8')
+        "\U0001f680".encode(encoding)
         return True
     except (UnicodeEncodeError, LookupError):
         return False
@@ -24,24 +31,67 @@ def _supports_emoji():
 
 EMOJI_SUPPORT = _supports_emoji()
 
-# Icons with fallback
-ICONS = {
-    'rocket': '\U0001f680' if EMOJI_SUPPORT else '[>]',
-    'folder': '\U0001f4c1' if EMOJI_SUPPORT else '[D]',
-    'file': '\U0001f4c4' if EMOJI_SUPPORT else '[F]',
-    'check': '\u2705' if EMOJI_SUPPORT else '[OK]',
-    'error': '\u274c' if EMOJI_SUPPORT else '[X]',
-    'warning': '\u26a0\ufe0f' if EMOJI_SUPPORT else '[!]',
-    'info': '\u2139\ufe0f' if EMOJI_SUPPORT else '[i]',
-    'python': '\U0001f40d' if EMOJI_SUPPORT else '[Py]',
-    'package': '\U0001f4e6' if EMOJI_SUPPORT else '[P]',
-    'git': '\U0001f500' if EMOJI_SUPPORT else '[Git]',
-    'star': '\u2728' if EMOJI_SUPPORT else '[*]',
-    'tree': '\U0001f333' if EMOJI_SUPPORT else '[T]',
-    'gear': '\u2699\ufe0f' if EMOJI_SUPPORT else '[*]',
-    'link': '\U0001f517' if EMOJI_SUPPORT else '[>]',
+# Icons: emoji and ASCII fallback
+_ICONS_EMOJI = {
+    'rocket': '\U0001f680',
+    'folder': '\U0001f4c1',
+    'file': '\U0001f4c4',
+    'check': '\u2705',
+    'error': '\u274c',
+    'warning': '\u26a0\ufe0f',
+    'info': '\u2139\ufe0f',
+    'python': '\U0001f40d',
+    'package': '\U0001f4e6',
+    'git': '\U0001f500',
+    'star': '\u2728',
+    'tree': '\U0001f333',
+    'gear': '\u2699\ufe0f',
+    'link': '\U0001f517',
+}
+
+_ICONS_ASCII = {
+    'rocket': '[>]',
+    'folder': '[D]',
+    'file': '[F]',
+    'check': '[OK]',
+    'error': '[X]',
+    'warning': '[!]',
+    'info': '[i]',
+    'python': '[Py]',
+    'package': '[P]',
+    'git': '[Git]',
+    'star': '[*]',
+    'tree': '[T]',
+    'gear': '[*]',
+    'link': '[>]',
 }
 
+ICONS = _ICONS_EMOJI if EMOJI_SUPPORT else _ICONS_ASCII
+
+# Formatos fixos dos print_* (ícone + markup), montados uma vez
+_SUCCESS_FMT = ICONS['check'] + " [bold green]{}[/bold green]"
+_ERROR_FMT = ICONS['error'] + " [bold red]{}[/bold red]"
+_WARNING_FMT = ICONS['warning'] + " [yellow]{}[/yellow]"
+_INFO_FMT = ICONS['info'] + " [dim]{}[/dim]"
+_STEP_FMT = "  [cyan]" + ICONS['gear'] + "[/cyan] {}"
+
+# Cor de cada extensão na listagem de arquivos
+_EXT_STYLE = {
+    'py': 'green',
+    'html': 'yellow',
+    'css': 'yellow',
+    'js': 'yellow',
+}
+
+
+def _file_label(name: str) -> str:
+    """Ícone + nome do arquivo, colorido pela extensão."""
+    _, dot, ext = name.rpartition('.')
+    style = _EXT_STYLE.get(ext) if dot else None
+    if style:
+        return f"{ICONS['file']} [{style}]{name}[/{style}]"
+    return f"{ICONS['file']} {name}"
+
 
 def print_header(title: str, subtitle: str = None):
     """Imprime o cabeçalho bonito."""
@@ -69,33 +119,31 @@ def print_header(title: str, subtitle: str = None):
 
 def print_success(message: str):
     """Mostra mensagem de sucesso."""
-    console.print(f"{ICONS['check']} [bold green]{message}[/bold green]")
+    console.print(_SUCCESS_FMT.format(message))
 
 
 def print_error(message: str):
     """Mostra erro."""
-    console.print(f"{ICONS['error']} [bold red]{message}[/bold red]")
+    console.print(_ERROR_FMT.format(message))
 
 
 def print_warning(message: str):
     """Mostra aviso."""
-    console.print(f"{ICONS['warning']} [yellow]{message}[/yellow]")
+    console.print(_WARNING_FMT.format(message))
 
 
 def print_info(message: str):
     """Mostra info."""
-    console.print(f"{ICONS['info']} [dim]{message}[/dim]")
+    console.print(_INFO_FMT.format(message))
 
 
 def print_step(message: str):
     """Mostra um passo do processo."""
-    console.print(f"  [cyan]{ICONS['gear']}[/cyan] {message}")
+    console.print(_STEP_FMT.format(message))
 
 
 def print_summary(project_path: str, project_type: str, options: dict = None):
     """Mostra resumo do que foi criado."""
-    console.print()
-
     table = Table(
         show_header=False,
         box=box.ROUNDED,
@@ -121,15 +169,15 @@ def print_summary(project_path: str, project_type: str, options: dict = None):
         title=f"{ICONS['star']} [bold green]{t('project_created')}[/bold green]",
         border_style="green",
     )
-    console.print(panel)
+    # Linha em branco + painel num único print
+    console.print(Group("", panel))
 
 
 def print_next_steps(steps: list):
-    """Mostra próximos passos."""
-    console.print()
-    console.print(f"{ICONS['link']} [bold]{t('next_steps')}:[/bold]")
-    for i, step in enumerate(steps, 1):
-        console.print(f"   [dim]{i}.[/dim] [cyan]{step}[/cyan]")
+    """Mostra próximos passos (renderizados num único print)."""
+    lines = ["", f"{ICONS['link']} [bold]{t('next_steps')}:[/bold]"]
+    lines.extend(f"   [dim]{i}.[/dim] [cyan]{step}[/cyan]" for i, step in enumerate(steps, 1))
+    console.print(Group(*lines))
 
 
 def print_command(cmd: str):
@@ -142,24 +190,16 @@ def print_creating(item_type: str, name: str):
     if item_type == 'dir':
         console.print(f"    {ICONS['folder']} [blue]{name}/[/blue]")
     else:
-        if name.endswith('.py'):
-            console.print(f"    {ICONS['file']} [green]{name}[/green]")
-        elif name.endswith(('.html', '.css', '.js')):
-            console.print(f"    {ICONS['file']} [yellow]{name}[/yellow]")
-        else:
-            console.print(f"    {ICONS['file']} {name}")
+        console.print(f"    {_file_label(name)}")
 
 
-def print_template_info(template):
+def print_template_info(template, files=None):
     """Display template information in a Rich table.
 
     Args:
         template: Template object with metadata
+        files: Result of ``template.get_file_tree()``, if already computed
     """
-    from rich.tree import Tree
-
-    console.print()
-
     table = Table(
         show_header=False,
         box=box.ROUNDED,
@@ -189,7 +229,8 @@ def print_template_info(template):
         table.add_row(t('template_variables'), str(var_count))
 
     # File count
-    files = template.get_file_tree()
+    if files is None:
+        files = template.get_file_tree()
     table.add_row(t('template_files'), str(len(files)))
 
     panel = Panel(
@@ -197,66 +238,67 @@ def print_template_info(template):
         title=f"{ICONS['star']} [bold cyan]{t('template_details')}[/bold cyan]",
         border_style="cyan",
     )
-    console.print(panel)
+    console.print(Group("", panel))
 
 
-def print_template_tree(template):
+def print_template_tree(template, files=None):
     """Display template file structure as a tree.
 
     Args:
         template: Template object
+        files: Result of ``template.get_file_tree()``, if already computed
     """
-    from rich.tree import Tree
-
-    console.print()
     tree = Tree(
         f"{ICONS['tree']} [bold cyan]{template.name}/[/bold cyan]",
         guide_style="dim"
     )
 
-    files = template.get_file_tree()
-
-    # Build tree structure
-    dirs = {}
+    # Sorted by parts, every directory's entries are contiguous, so the
+    # open directories can be tracked with a stack of (prefix, node)
+    if files is None:
+        files = template.get_file_tree()
+    files = sorted(files, key=lambda p: p.parts)
+    stack = [((), tree)]
 
     for file_path in files:
         parts = file_path.parts
+        dir_parts = parts[:-1]
 
-        # Create directory nodes
-        current_tree = tree
-        for i, part in enumerate(parts[:-1]):
-            path_key = '/'.join(parts[:i+1])
+        # Close directories that are not ancestors of this file
+        while stack[-1][0] != dir_parts[:len(stack[-1][0])]:
+            stack.pop()
 
-            if path_key not in dirs:
-                dirs[path_key] = current_tree.add(f"{ICONS['folder']} [blue]{part}/[/blue]")
+        # Open the missing directory nodes
+        for i in range(len(stack[-1][0]), len(dir_parts)):
+            node = stack[-1][1].add(f"{ICONS['folder']} [blue]{dir_parts[i]}/[/blue]")
+            stack.append((dir_parts[:i + 1], node))
 
-            current_tree = dirs[path_key]
+        current_tree = stack[-1][1]
 
         # Add file
-        filename = parts[-1]
-        if filename.endswith('.py'):
-            current_tree.add(f"{ICONS['file']} [green]{filename}[/green]")
-        elif filename.endswith(('.html', '.css', '.js')):
-            current_tree.add(f"{ICONS['file']} [yellow]{filename}[/yellow]")
-        else:
-            current_tree.add(f"{ICONS['file']} {filename}")
+        current_tree.add(_file_label(parts[-1]))
 
-    console.print(tree)
+    console.print(Group("", tree))
 
 
-def print_template_list(templates: list, builtin_templates: list = None, verbose: bool = False):
+def print_template_list(templates: Iterable, builtin_templates: list = None, verbose: bool = False):
     """Display list of templates.
 
+    Custom templates are printed as they are produced, so ``templates`` may
+    be a lazy iterator (see ``iter_custom_templates``); their count is
+    printed after the last one.
+
     Args:
-        templates: List of Template objects (custom templates)
+        templates: Iterable of Template objects (custom templates)
         builtin_templates: List of built-in template info dicts
         verbose: Show detailed information
     """
-    console.print()
+    # Everything up to the custom templates header goes out in one print
+    renderables: List[RenderableType] = [""]
 
     # Built-in templates
     if builtin_templates:
-        console.print(f"[bold cyan]{t('builtin_templates')}:[/bold cyan]")
+        renderables.append(f"[bold cyan]{t('builtin_templates')}:[/bold cyan]")
 
         if verbose:
             table = Table(
@@ -270,34 +312,40 @@ def print_template_list(templates: list, builtin_templates: list = None, verbose
             for tpl in builtin_templates:
                 table.add_row(tpl['name'], tpl.get('description', ''))
 
-            console.print(table)
+            renderables.append(table)
         else:
-            for tpl in builtin_templates:
-                console.print(f"  {ICONS['star']} [cyan]{tpl['name']}[/cyan] - {tpl.get('description', '')}")
+            renderables.extend(
+                f"  {ICONS['star']} [cyan]{tpl['name']}[/cyan] - {tpl.get('description', '')}"
+                for tpl in builtin_templates
+            )
 
-        console.print()
+        renderables.append("")
 
     # Custom templates
-    console.print(f"[bold cyan]{t('custom_templates')} ({len(templates)}):[/bold cyan]")
-
-    if not templates:
-        console.print(f"  [dim]{t('no_custom_templates')}[/dim]")
-        return
+    renderables.append(f"[bold cyan]{t('custom_templates')}:[/bold cyan]")
+    console.print(Group(*renderables))
 
-    if verbose:
-        for template in templates:
+    count = 0
+    for template in templates:
+        count += 1
+        if verbose:
             print_template_info(template)
             console.print()
-    else:
-        for template in templates:
+        else:
             desc = template.metadata.description or "[dim]No description[/dim]"
             author = f" by {template.metadata.author}" if template.metadata.author else ""
             created = template.metadata.created_at.split('T')[0] if template.metadata.created_at else ""
 
-            console.print(f"  {ICONS['package']} [bold cyan]{template.name}[/bold cyan]")
-            console.print(f"    {desc}")
+            lines = [f"  {ICONS['package']} [bold cyan]{template.name}[/bold cyan]", f"    {desc}"]
             if author or created:
-                console.print(f"    [dim]{author}{' - ' if author and created else ''}{created}[/dim]")
+                lines.append(f"    [dim]{author}{' - ' if author and created else ''}{created}[/dim]")
+            console.print(Group(*lines))
+
+    if count:
+        # The total is only known once the iterator is exhausted
+        console.print(f"[dim]{t('custom_templates')} ({count})[/dim]")
+    else:
+        console.print(f"  [dim]{t('no_custom_templates')}[/dim]")
 
 
 def print_variable_prompt(variable):
@@ -309,6 +357,7 @@ def print_variable_prompt(variable):
     required_text = "[red]*[/red]" if variable.required else ""
     type_text = f"[dim]({variable.type})[/dim]"
 
-    console.print(f"{required_text} [cyan]{variable.name}[/cyan] {type_text}")
+    lines = [f"{required_text} [cyan]{variable.name}[/cyan] {type_text}"]
     if variable.description:
-        console.print(f"  [dim]{variable.description}[/dim]")
+        lines.append(f"  [dim]{variable.description}[/dim]")
+    console.print(Group(*lines))
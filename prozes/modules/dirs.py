@@ -1,32 +1,28 @@
 """Módulo para criação de diretórios e configuração Git."""
 
+import os
+import shutil
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict
 import click
 import re
 
-
-def create_project_folder(project_name, verbose=False):
-    """Cria a pasta do projeto no diretório atual do usuário."""
-    current_dir = Path.cwd()
-    project_path = current_dir / project_name
-
-    project_path.mkdir(parents=True, exist_ok=True)
-
-    if verbose:
-        click.echo(f"[*] Pasta criada em: {project_path}")
-
-    return project_path
-
-
-def create_gitignore(project_path, verbose=False):
-    """Cria arquivo .gitignore para projetos Python.
-
-    Args:
-        project_path: Path do projeto
-        verbose: Modo verboso
-    """
-    gitignore_content = """# Python
+# Padrões válidos de URL de remote (compilados uma vez):
+# - https://github.com/user/repo.git
+# - git@github.com:user/repo.git
+# - https://gitlab.com/user/repo.git
+# - https://bitbucket.org/user/repo.git
+_GIT_URL_PATTERNS = (
+    re.compile(r'^https?://[a-zA-Z0-9.-]+/[\w.-]+/[\w.-]+(\.git)?$'),  # HTTPS
+    re.compile(r'^git@[a-zA-Z0-9.-]+:[\w.-]+/[\w.-]+(\.git)?$'),        # SSH
+)
+_GIT_URL_PREFIXES = ('http://', 'https://', 'git@')
+
+# Conteúdo do .gitignore gerado, já codificado (gravado sem reprocessar)
+_GITIGNORE_TEXT = """# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -83,9 +79,61 @@ htmlcov/
 .DS_Store
 Thumbs.db
 """
+# Com o newline da plataforma (CRLF no Windows), como fazia o write_text()
+_GITIGNORE_BYTES = _GITIGNORE_TEXT.strip().replace('\n', os.linesep).encode('utf-8')
+
+# O_BINARY só existe no Windows (evita a tradução de \n para \r\n)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+# Conteúdo de .git/HEAD quando aponta para um branch
+_HEAD_REF_PREFIX = 'ref: refs/heads/'
+
+# No Windows, o git roda sem alocar console/janela; um STARTUPINFO
+# compartilhado por todas as chamadas
+_SUBPROCESS_KWARGS: Dict[str, Any] = {}
+if sys.platform == 'win32':
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _STARTUPINFO.wShowWindow = subprocess.SW_HIDE
+    _SUBPROCESS_KWARGS = {
+        'startupinfo': _STARTUPINFO,
+        'creationflags': subprocess.CREATE_NO_WINDOW,
+    }
+
+
+@lru_cache(maxsize=1)
+def _git_executable():
+    """Resolve o executavel do Git uma vez so por processo."""
+    return shutil.which('git') or 'git'
+
+
+def create_project_folder(project_name, verbose=False):
+    """Cria a pasta do projeto no diretório atual do usuário."""
+    project_dir = os.path.join(os.getcwd(), project_name)
+    os.makedirs(project_dir, exist_ok=True)
+
+    if verbose:
+        click.echo(f"[*] Pasta criada em: {project_dir}")
 
+    return Path(project_dir)
+
+
+def create_gitignore(project_path, verbose=False):
+    """Cria arquivo .gitignore para projetos Python.
+
+    Args:
+        project_path: Path do projeto
+        verbose: Modo verboso
+    """
     gitignore_path = project_path / '.gitignore'
-    gitignore_path.write_text(gitignore_content.strip())
+
+    # Escrita direta do buffer fixo, sem passar pela pilha de io
+    fd = os.open(gitignore_path, _WRITE_FLAGS, 0o644)
+    try:
+        os.write(fd, _GITIGNORE_BYTES)
+    finally:
+        os.close(fd)
 
     if verbose:
         click.echo("[OK] .gitignore criado")
@@ -103,22 +151,11 @@ def validate_git_remote_url(url):
     if not url:
         return True  # URL vazia é válida (usuário pode pular)
 
-    # Padrões válidos:
-    # - https://github.com/user/repo.git
-    # - git@github.com:user/repo.git
-    # - https://gitlab.com/user/repo.git
-    # - https://bitbucket.org/user/repo.git
-
-    patterns = [
-        r'^https?://[a-zA-Z0-9.-]+/[\w.-]+/[\w.-]+(\.git)?$',  # HTTPS
-        r'^git@[a-zA-Z0-9.-]+:[\w.-]+/[\w.-]+(\.git)?$',        # SSH
-    ]
-
-    for pattern in patterns:
-        if re.match(pattern, url):
-            return True
+    # Descarta logo o que não pode ser HTTPS nem SSH, sem entrar no regex
+    if not url.startswith(_GIT_URL_PREFIXES):
+        return False
 
-    return False
+    return any(pattern.match(url) for pattern in _GIT_URL_PATTERNS)
 
 
 def check_git_config(verbose=False):
@@ -131,30 +168,31 @@ def check_git_config(verbose=False):
         tuple: (has_name, has_email)
     """
     try:
-        # Verificar user.name
-        name_result = subprocess.run(
-            ['git', 'config', '--global', 'user.name'],
+        # Uma única chamada ao git lê user.name e user.email
+        result = subprocess.run(
+            [_git_executable(), 'config', '--global', '--get-regexp', r'^user\.(name|email)$'],
             capture_output=True,
-            text=True
+            text=True,
+            **_SUBPROCESS_KWARGS
         )
-        has_name = bool(name_result.stdout.strip())
+        values = {}
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(' ')
+            values[key] = value.strip()
 
-        # Verificar user.email
-        email_result = subprocess.run(
-            ['git', 'config', '--global', 'user.email'],
-            capture_output=True,
-            text=True
-        )
-        has_email = bool(email_result.stdout.strip())
+        user_name = values.get('user.name', '')
+        user_email = values.get('user.email', '')
+        has_name = bool(user_name)
+        has_email = bool(user_email)
 
         if verbose:
             if has_name:
-                click.echo(f"[OK] Git user.name: {name_result.stdout.strip()}")
+                click.echo(f"[OK] Git user.name: {user_name}")
             else:
                 click.echo("[AVISO] Git user.name nao configurado")
 
             if has_email:
-                click.echo(f"[OK] Git user.email: {email_result.stdout.strip()}")
+                click.echo(f"[OK] Git user.email: {user_email}")
             else:
                 click.echo("[AVISO] Git user.email nao configurado")
 
@@ -190,16 +228,30 @@ def command_git(project_path, verbose=False):
                 click.echo("    Execute: git config --global user.email \"seu@email.com\"")
             click.echo()
 
-        # 1. git init
+        # Todos os comandos rodam com -C apontando pro projeto
+        project_dir = os.fspath(project_path)
+        git = [_git_executable(), '-C', project_dir]
+
+        # 1. git init (Git >= 2.28 já cria o branch main com -b)
         git_init_result = subprocess.run(
-            ['git', 'init'],
-            cwd=str(project_path),
-            capture_output=True,
-            text=True
+            git + ['init', '-b', 'main'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            **_SUBPROCESS_KWARGS
         )
+        branch_is_main = git_init_result.returncode == 0
+
+        if not branch_is_main:
+            # Git antigo não conhece -b: init simples e renomeia depois
+            subprocess.run(
+                git + ['init'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **_SUBPROCESS_KWARGS
+            )
 
-        git_dir = project_path / '.git'
-        success = git_dir.exists()
+        git_dir = os.path.join(project_dir, '.git')
+        success = os.path.isdir(git_dir)
 
         if verbose:
             if success:
@@ -214,22 +266,28 @@ def command_git(project_path, verbose=False):
         # 2. Criar .gitignore
         create_gitignore(project_path, verbose=verbose)
 
-        # 3. Configurar branch main
-        branch_result = subprocess.run(
-            ['git', 'branch', '--show-current'],
-            cwd=str(project_path),
-            capture_output=True,
-            text=True
-        )
-        current_branch = branch_result.stdout.strip()
-
-        if current_branch != 'main':
-            subprocess.run(
-                ['git', 'branch', '-M', 'main'],
-                cwd=str(project_path),
-                capture_output=True,
-                text=True
-            )
+        # 3. Configurar branch main (só necessário sem o init -b)
+        if not branch_is_main:
+            # Repo recém-criado: o branch atual está em .git/HEAD
+            # ("ref: refs/heads/<nome>"), sem precisar de outro processo
+            try:
+                with open(os.path.join(git_dir, 'HEAD')) as head_file:
+                    head_text = head_file.read().strip()
+            except OSError:
+                head_text = ''
+            # O nome do branch pode ter '/' (ex.: init.defaultBranch=team/main)
+            if head_text.startswith(_HEAD_REF_PREFIX):
+                current_branch = head_text[len(_HEAD_REF_PREFIX):]
+            else:
+                current_branch = ''
+
+            if current_branch != 'main':
+                subprocess.run(
+                    git + ['branch', '-M', 'main'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    **_SUBPROCESS_KWARGS
+                )
         if verbose:
             click.echo("[*] Branch 'main' configurado")
 
@@ -253,10 +311,10 @@ def command_git(project_path, verbose=False):
 
             # Adicionar remote
             remote_result = subprocess.run(
-                ['git', 'remote', 'add', 'origin', git_remote],
-                cwd=str(project_path),
-                capture_output=True,
-                text=True
+                git + ['remote', 'add', 'origin', git_remote],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                **_SUBPROCESS_KWARGS
             )
 
             if remote_result.returncode == 0:
@@ -264,17 +322,17 @@ def command_git(project_path, verbose=False):
                     click.echo(f"[OK] Remote 'origin' configurado: {git_remote}")
                 break
             else:
-                click.echo(f"[ERRO] Falha ao adicionar remote: {remote_result.stderr.strip()}")
+                click.echo(f"[ERRO] Falha ao adicionar remote: {remote_result.stderr.decode('utf-8', 'replace').strip()}")
                 continue
 
         # 5. Commit inicial
         if click.confirm('\nFazer commit inicial?', default=True):
             # git add .
             add_result = subprocess.run(
-                ['git', 'add', '.'],
-                cwd=str(project_path),
-                capture_output=True,
-                text=True
+                git + ['add', '.'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                **_SUBPROCESS_KWARGS
             )
 
             if add_result.returncode == 0:
@@ -284,19 +342,19 @@ def command_git(project_path, verbose=False):
                 # git commit
                 commit_msg = "Initial commit"
                 commit_result = subprocess.run(
-                    ['git', 'commit', '-m', commit_msg],
-                    cwd=str(project_path),
-                    capture_output=True,
-                    text=True
+                    git + ['commit', '-m', commit_msg],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    **_SUBPROCESS_KWARGS
                 )
 
                 if commit_result.returncode == 0:
                     if verbose:
                         click.echo("[OK] Commit inicial criado")
                 else:
-                    click.echo(f"[AVISO] Falha ao criar commit: {commit_result.stderr.strip()}")
+                    click.echo(f"[AVISO] Falha ao criar commit: {commit_result.stderr.decode('utf-8', 'replace').strip()}")
             else:
-                click.echo(f"[AVISO] Falha ao adicionar arquivos: {add_result.stderr.strip()}")
+                click.echo(f"[AVISO] Falha ao adicionar arquivos: {add_result.stderr.decode('utf-8', 'replace').strip()}")
 
         return True
 
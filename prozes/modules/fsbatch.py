@@ -0,0 +1,79 @@
+"""Batched filesystem writes for project scaffolding."""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Union
+
+# Arquivos sao gravados com os.open/os.write direto no fd, sem a camada
+# de buffer do open(); O_BINARY evita traducao de newline no Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Texto continua saindo com o newline da plataforma (CRLF no Windows), como
+# fazia o write_text(); bytes sao gravados sem alteracao
+_NATIVE_NEWLINE = os.linesep if os.linesep != '\n' else None
+
+
+class FSBatch:
+    """Collects directory creations and file writes and flushes them at once.
+
+    Directories are deduplicated and only the deepest ones are created
+    (``os.makedirs`` creates the parents), so a scaffold issues one
+    ``makedirs`` per leaf directory instead of one ``mkdir`` per level.
+    Nothing touches the disk until ``commit()``.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self._dirs: List[str] = []
+        self._files: Dict[str, bytes] = {}
+
+    def mkdir(self, relative_path: str) -> None:
+        """Schedule creation of a directory relative to the root."""
+        self._dirs.append(relative_path)
+
+    def write(self, relative_path: str, content: Union[str, bytes]) -> None:
+        """Schedule a file write relative to the root.
+
+        str is written with the platform's newline and UTF-8 encoded; bytes
+        are written as-is.
+        """
+        if isinstance(content, str):
+            if _NATIVE_NEWLINE is not None:
+                content = content.replace('\n', _NATIVE_NEWLINE)
+            content = content.encode('utf-8')
+        self._files[relative_path] = content
+
+    def _leaf_dirs(self) -> List[str]:
+        """Return the scheduled directories that are not a parent of another."""
+        wanted = {os.path.normpath(d) for d in self._dirs}
+        wanted.update(os.path.dirname(os.path.normpath(f)) for f in self._files)
+        wanted.discard('')
+
+        parents = set()
+        for path in wanted:
+            parent = os.path.dirname(path)
+            while parent and parent not in parents:
+                parents.add(parent)
+                parent = os.path.dirname(parent)
+
+        return sorted(wanted - parents)
+
+    def commit(self) -> None:
+        """Create the directories and write every scheduled file."""
+        root = os.fspath(self.root)
+        os.makedirs(root, exist_ok=True)
+
+        for relative_dir in self._leaf_dirs():
+            os.makedirs(os.path.join(root, relative_dir), exist_ok=True)
+
+        for relative_path, content in self._files.items():
+            fd = os.open(os.path.join(root, relative_path), _WRITE_FLAGS, 0o666)
+            try:
+                view = memoryview(content)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+
+        self._dirs.clear()
+        self._files.clear()
@@ -1,131 +1,118 @@
 """Modulo para geracao de arquivos de dependencias."""
 
+import os
 from pathlib import Path
 
+# Arquivos gravados com o newline da plataforma (CRLF no Windows), como
+# fazia o write_text()
+_NATIVE_NEWLINE = os.linesep.encode() if os.linesep != '\n' else None
 
-REQUIREMENTS_TEMPLATES = {
-    # MVC
-    'web-flask': """flask>=3.0.0
-python-dotenv>=1.0.0
+
+# Os templates ficam em bytes: sao gravados direto, sem encode por projeto.
+# Trechos repetidos entre os tipos de projeto sao definidos uma vez so
+_BASE_REQS = b"""python-dotenv>=1.0.0
 pytest>=8.0.0
-""",
-    'web-fastapi': """fastapi>=0.109.0
+"""
+_FLASK_REQS = b"flask>=3.0.0\n" + _BASE_REQS
+_FASTAPI_HEAD = b"""fastapi>=0.109.0
 uvicorn[standard]>=0.27.0
-jinja2>=3.1.0
+"""
+_FASTAPI_REQS = _FASTAPI_HEAD + b"pydantic[email]>=2.0.0\n" + _BASE_REQS
+
+REQUIREMENTS_TEMPLATES = {
+    # MVC
+    'web-flask': _FLASK_REQS,
+    'web-fastapi': _FASTAPI_HEAD + b"""jinja2>=3.1.0
 python-multipart>=0.0.6
 pydantic[email]>=2.0.0
-python-dotenv>=1.0.0
-pytest>=8.0.0
-""",
+""" + _BASE_REQS,
     # API REST
-    'api-flask': """flask>=3.0.0
-python-dotenv>=1.0.0
-pytest>=8.0.0
-""",
-    'api-fastapi': """fastapi>=0.109.0
-uvicorn[standard]>=0.27.0
-pydantic[email]>=2.0.0
-python-dotenv>=1.0.0
-pytest>=8.0.0
-""",
+    'api-flask': _FLASK_REQS,
+    'api-fastapi': _FASTAPI_REQS,
     # CLI
-    'cli': """click>=8.0.0
+    'cli': b"""click>=8.0.0
 pytest>=8.0.0
 """,
     # Clean Architecture
-    'clean-flask': """flask>=3.0.0
-python-dotenv>=1.0.0
-pytest>=8.0.0
-""",
-    'clean-fastapi': """fastapi>=0.109.0
-uvicorn[standard]>=0.27.0
-pydantic[email]>=2.0.0
-python-dotenv>=1.0.0
-pytest>=8.0.0
-""",
+    'clean-flask': b"flask>=3.0.0\norjson>=3.9.0\n" + _BASE_REQS,
+    'clean-fastapi': _FASTAPI_HEAD + b"pydantic[email]>=2.0.0\norjson>=3.9.0\n" + _BASE_REQS,
 }
 
-DEFAULT_REQUIREMENTS = """python-dotenv>=1.0.0
-pytest>=8.0.0
-"""
+DEFAULT_REQUIREMENTS = _BASE_REQS
 
 # Authentication dependencies
 AUTH_DEPENDENCIES = {
-    'jwt': ['PyJWT>=2.8.0', 'passlib>=1.7.4', 'bcrypt>=4.0.0,<5.0.0', 'python-jose[cryptography]>=3.3.0'],
-    'oauth2': ['authlib>=1.3.0', 'passlib>=1.7.4', 'bcrypt>=4.0.0,<5.0.0', 'requests>=2.31.0', 'itsdangerous>=2.1.0'],
-    'session': ['passlib>=1.7.4', 'bcrypt>=4.0.0,<5.0.0', 'itsdangerous>=2.1.0'],
-    'basic': ['passlib>=1.7.4', 'bcrypt>=4.0.0,<5.0.0'],
+    'jwt': ['PyJWT>=2.8.0', 'bcrypt>=4.0.0,<5.0.0', 'python-jose[cryptography]>=3.3.0'],
+    'oauth2': ['authlib>=1.3.0', 'bcrypt>=4.0.0,<5.0.0', 'requests>=2.31.0', 'itsdangerous>=2.1.0'],
+    'session': ['bcrypt>=4.0.0,<5.0.0', 'itsdangerous>=2.1.0'],
+    'basic': ['bcrypt>=4.0.0,<5.0.0'],
 }
 
+# Bloco "# Authentication dependencies" de cada auth, ja pronto em bytes
+_AUTH_DEPENDENCIES_BLOCKS = {
+    auth: ('\n\n# Authentication dependencies\n' + ''.join(f'{dep}\n' for dep in deps)).encode('utf-8')
+    for auth, deps in AUTH_DEPENDENCIES.items()
+}
 
-ENV_TEMPLATES = {
-    # MVC
-    'web-flask': """# Flask Configuration
-FLASK_APP=main.py
-FLASK_ENV=development
-SECRET_KEY=your-secret-key-here-change-in-production
-DEBUG=True
-
-# Database
-DATABASE_URL=sqlite:///app.db
 
+# Trechos de .env comuns a varios tipos de projeto
+_SECRET_KEY_ENV = b"SECRET_KEY=your-secret-key-here-change-in-production\n"
+_FLASK_ENV_HEAD = b"""FLASK_APP=main.py
+FLASK_ENV=development
+""" + _SECRET_KEY_ENV + b"DEBUG=True\n"
+_FLASK_SERVER_ENV = b"""
 # Server
 HOST=0.0.0.0
 PORT=5000
-""",
-    'web-fastapi': """# FastAPI Configuration
-APP_NAME=MyApp
-DEBUG=True
-SECRET_KEY=your-secret-key-here-change-in-production
-
-# Database
-DATABASE_URL=sqlite:///./app.db
-
+"""
+_FASTAPI_SERVER_ENV = b"""
 # Server
 HOST=0.0.0.0
 PORT=8000
+"""
+_CORS_ANY_ENV = b"""
+# CORS
+CORS_ORIGINS=*
+"""
 
+ENV_TEMPLATES = {
+    # MVC
+    'web-flask': b"# Flask Configuration\n" + _FLASK_ENV_HEAD + b"""
+# Database
+DATABASE_URL=sqlite:///app.db
+""" + _FLASK_SERVER_ENV,
+    'web-fastapi': b"""# FastAPI Configuration
+APP_NAME=MyApp
+DEBUG=True
+""" + _SECRET_KEY_ENV + b"""
+# Database
+DATABASE_URL=sqlite:///./app.db
+""" + _FASTAPI_SERVER_ENV + b"""
 # CORS
 CORS_ORIGINS=http://localhost:3000,http://localhost:8000
 """,
     # API REST
-    'api-flask': """# Flask API Configuration
-FLASK_APP=main.py
-FLASK_ENV=development
-SECRET_KEY=your-secret-key-here-change-in-production
-DEBUG=True
-
+    'api-flask': b"# Flask API Configuration\n" + _FLASK_ENV_HEAD + b"""
 # Database
 DATABASE_URL=sqlite:///api.db
 
 # API Configuration
 API_VERSION=v1
 RATE_LIMIT=100
-
-# CORS
-CORS_ORIGINS=*
-""",
-    'api-fastapi': """# FastAPI API Configuration
+""" + _CORS_ANY_ENV,
+    'api-fastapi': b"""# FastAPI API Configuration
 APP_NAME=MyAPI
 DEBUG=True
-SECRET_KEY=your-secret-key-here-change-in-production
-
+""" + _SECRET_KEY_ENV + b"""
 # Database
 DATABASE_URL=sqlite:///./api.db
 
 # API Configuration
 API_VERSION=v1
 API_PREFIX=/api/v1
-
-# CORS
-CORS_ORIGINS=*
-
-# Server
-HOST=0.0.0.0
-PORT=8000
-""",
+""" + _CORS_ANY_ENV + _FASTAPI_SERVER_ENV,
     # CLI
-    'cli': """# CLI Configuration
+    'cli': b"""# CLI Configuration
 LOG_LEVEL=INFO
 CONFIG_PATH=~/.config/myapp
 DEBUG=False
@@ -135,37 +122,20 @@ VERBOSE=False
 COLOR_OUTPUT=True
 """,
     # Clean Architecture
-    'clean-flask': """# Flask Configuration
-FLASK_APP=main.py
-FLASK_ENV=development
-SECRET_KEY=your-secret-key-here-change-in-production
-DEBUG=True
-
+    'clean-flask': b"# Flask Configuration\n" + _FLASK_ENV_HEAD + b"""
 # Database
 DATABASE_URL=sqlite:///clean.db
-
-# Server
-HOST=0.0.0.0
-PORT=5000
-""",
-    'clean-fastapi': """# FastAPI Configuration
+""" + _FLASK_SERVER_ENV,
+    'clean-fastapi': b"""# FastAPI Configuration
 APP_NAME=MyCleanApp
 DEBUG=True
-SECRET_KEY=your-secret-key-here-change-in-production
-
+""" + _SECRET_KEY_ENV + b"""
 # Database
 DATABASE_URL=sqlite:///./clean.db
-
-# Server
-HOST=0.0.0.0
-PORT=8000
-
-# CORS
-CORS_ORIGINS=*
-""",
+""" + _FASTAPI_SERVER_ENV + _CORS_ANY_ENV,
 }
 
-DEFAULT_ENV = """# Application Configuration
+DEFAULT_ENV = b"""# Application Configuration
 DEBUG=True
 LOG_LEVEL=INFO
 
@@ -174,14 +144,14 @@ LOG_LEVEL=INFO
 
 # Authentication environment templates
 AUTH_ENV_TEMPLATES = {
-    'jwt': """
+    'jwt': b"""
 # JWT Authentication
 JWT_SECRET_KEY=your-super-secret-jwt-key-change-in-production-min-32-chars
 JWT_ALGORITHM=HS256
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES=30
 JWT_REFRESH_TOKEN_EXPIRE_DAYS=7
 """,
-    'oauth2': """
+    'oauth2': b"""
 # OAuth2 Authentication
 OAUTH2_CLIENT_ID=your-oauth2-client-id
 OAUTH2_CLIENT_SECRET=your-oauth2-client-secret
@@ -190,7 +160,7 @@ OAUTH2_AUTHORIZATION_URL=https://provider.com/oauth/authorize
 OAUTH2_TOKEN_URL=https://provider.com/oauth/token
 OAUTH2_USER_INFO_URL=https://provider.com/oauth/userinfo
 """,
-    'session': """
+    'session': b"""
 # Session Authentication
 SESSION_SECRET_KEY=your-super-secret-session-key-change-in-production
 SESSION_COOKIE_NAME=session
@@ -199,7 +169,7 @@ SESSION_COOKIE_SECURE=False
 SESSION_PERMANENT=True
 SESSION_LIFETIME_DAYS=7
 """,
-    'basic': """
+    'basic': b"""
 # Basic Authentication
 BASIC_AUTH_REALM=Protected Area
 BASIC_AUTH_FORCE=True
@@ -207,40 +177,54 @@ BASIC_AUTH_FORCE=True
 }
 
 
-def create_default_requirements(project_path, project_type, auth_type='none'):
+def create_default_requirements(project_path, project_type, auth_type='none', batch=None):
     """Cria um requirements.txt padrao baseado no tipo de projeto.
 
     Args:
         project_path: Path do projeto
         project_type: Tipo do projeto (web-flask, api-fastapi, etc)
         auth_type: Tipo de autenticacao (none, jwt, oauth2, session, basic)
+        batch: FSBatch opcional; se passado, a escrita fica agendada nele
     """
     content = REQUIREMENTS_TEMPLATES.get(project_type, DEFAULT_REQUIREMENTS)
 
     # Add auth dependencies if auth is enabled
-    if auth_type != 'none' and auth_type in AUTH_DEPENDENCIES:
-        auth_deps = AUTH_DEPENDENCIES[auth_type]
-        content = content.rstrip() + '\n\n# Authentication dependencies\n'
-        for dep in auth_deps:
-            content += f'{dep}\n'
+    auth_block = _AUTH_DEPENDENCIES_BLOCKS.get(auth_type)
+    if auth_block is not None:
+        content = content.rstrip() + auth_block
+
+    if _NATIVE_NEWLINE is not None:
+        content = content.replace(b'\n', _NATIVE_NEWLINE)
+
+    if batch is not None:
+        batch.write('requirements.txt', content)
+        return
 
     requirements_file = Path(project_path) / 'requirements.txt'
-    requirements_file.write_text(content, encoding='utf-8')
+    requirements_file.write_bytes(content)
 
 
-def create_env_example(project_path, project_type, auth_type='none'):
+def create_env_example(project_path, project_type, auth_type='none', batch=None):
     """Cria um arquivo .env.example baseado no tipo de projeto.
 
     Args:
         project_path: Path do projeto
         project_type: Tipo do projeto (web-flask, api-fastapi, etc)
         auth_type: Tipo de autenticacao (none, jwt, oauth2, session, basic)
+        batch: FSBatch opcional; se passado, a escrita fica agendada nele
     """
     content = ENV_TEMPLATES.get(project_type, DEFAULT_ENV)
 
     # Add auth environment variables if auth is enabled
     if auth_type != 'none' and auth_type in AUTH_ENV_TEMPLATES:
-        content = content.rstrip() + '\n' + AUTH_ENV_TEMPLATES[auth_type]
+        content = content.rstrip() + b'\n' + AUTH_ENV_TEMPLATES[auth_type]
+
+    if _NATIVE_NEWLINE is not None:
+        content = content.replace(b'\n', _NATIVE_NEWLINE)
+
+    if batch is not None:
+        batch.write('.env.example', content)
+        return
 
     env_file = Path(project_path) / '.env.example'
-    env_file.write_text(content, encoding='utf-8')
+    env_file.write_bytes(content)
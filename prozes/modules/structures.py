@@ -1,76 +1,14 @@
 """Module for generating architecture structures."""
 
+from functools import partial
 from pathlib import Path
+from typing import Callable, NamedTuple
+
 from prozes.modules.console import print_creating, print_success, console
+from prozes.modules.fsbatch import FSBatch
 from prozes.modules.i18n import t
 
 
-# =============================================================================
-# BUILT-IN TEMPLATES REGISTRY
-# =============================================================================
-
-BUILTIN_TEMPLATES = {
-    'mvc-flask': {
-        'name': 'mvc-flask',
-        'display_name': 'MVC com Flask',
-        'description': 'Arquitetura MVC com Flask',
-        'function': lambda project_path, verbose: create_mvc_structure(project_path, 'web-flask', verbose),
-    },
-    'mvc-fastapi': {
-        'name': 'mvc-fastapi',
-        'display_name': 'MVC com FastAPI',
-        'description': 'Arquitetura MVC com FastAPI',
-        'function': lambda project_path, verbose: create_mvc_structure(project_path, 'web-fastapi', verbose),
-    },
-    'api-flask': {
-        'name': 'api-flask',
-        'display_name': 'API REST com Flask',
-        'description': 'API REST com Flask',
-        'function': lambda project_path, verbose: create_api_structure(project_path, 'api-flask', verbose),
-    },
-    'api-fastapi': {
-        'name': 'api-fastapi',
-        'display_name': 'API REST com FastAPI',
-        'description': 'API REST com FastAPI',
-        'function': lambda project_path, verbose: create_api_structure(project_path, 'api-fastapi', verbose),
-    },
-    'cli': {
-        'name': 'cli',
-        'display_name': 'CLI com Click',
-        'description': 'Aplicação CLI com Click',
-        'function': lambda project_path, verbose: create_cli_structure(project_path, verbose),
-    },
-    'clean-flask': {
-        'name': 'clean-flask',
-        'display_name': 'Clean Architecture com Flask',
-        'description': 'Clean Architecture com Flask',
-        'function': lambda project_path, verbose: create_clean_structure(project_path, 'clean-flask', verbose),
-    },
-    'clean-fastapi': {
-        'name': 'clean-fastapi',
-        'display_name': 'Clean Architecture com FastAPI',
-        'description': 'Clean Architecture com FastAPI',
-        'function': lambda project_path, verbose: create_clean_structure(project_path, 'clean-fastapi', verbose),
-    },
-}
-
-
-def get_builtin_template_list():
-    """Retorna lista de templates built-in para exibição.
-
-    Returns:
-        List of dicts with template info
-    """
-    return [
-        {
-            'name': tpl['name'],
-            'display_name': tpl.get('display_name', tpl['name']),
-            'description': tpl.get('description', '')
-        }
-        for tpl in BUILTIN_TEMPLATES.values()
-    ]
-
-
 # =============================================================================
 # TEMPLATES COMUNS
 # =============================================================================
@@ -802,11 +740,15 @@ if __name__ == "__main__":
 
 CLEAN_ENTITY = '''"""Entidades do dominio."""
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
+# slots=True (Python 3.10+): sem __dict__ por instancia
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class User:
     """Entidade User."""
     id: Optional[int] = None
@@ -891,12 +833,19 @@ class InMemoryUserRepository(UserRepositoryInterface):
 
 CLEAN_ADAPTER_PRESENTER = '''"""Presenters para formatacao de saida."""
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
+
+import orjson
+
 from src.entities.user import User
 
+# slots=True (Python 3.10+): sem __dict__ por instancia
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class UserViewModel:
     """View model do usuario."""
     id: int
@@ -926,15 +875,38 @@ class UserPresenter:
             "name": user.name,
             "email": user.email,
         }
+
+    @staticmethod
+    def to_json(user: User) -> bytes:
+        """Serializa direto para JSON (bytes), sem passar pelo view model."""
+        return orjson.dumps({
+            "id": user.id,
+            "name": user.name,
+            "email": user.email,
+        })
 '''
 
 CLEAN_FRAMEWORK_WEB_FLASK = '''"""Framework web (Flask)."""
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from src.use_cases.user import CreateUserUseCase, GetUserUseCase
 from src.adapters.repositories.user_repository import InMemoryUserRepository
 from src.adapters.presenters.user_presenter import UserPresenter
 
+# Corpo fixo do health check, serializado uma vez so
+_HEALTH_BODY = b'{"status":"ok"}'
+
+# Maximo de usuarios com JSON em cache por app (os mais antigos saem antes)
+_USER_JSON_MAX = 1024
+
+
+def _cache_user_json(cache: dict, user_id: int, body: bytes) -> bytes:
+    """Guarda o JSON de um usuario, descartando o mais antigo se estiver cheio."""
+    if len(cache) >= _USER_JSON_MAX and user_id not in cache:
+        del cache[next(iter(cache))]
+    cache[user_id] = body
+    return body
+
 
 def create_app() -> Flask:
     """Cria a aplicacao Flask."""
@@ -946,79 +918,130 @@ def create_app() -> Flask:
     get_user = GetUserUseCase(user_repo)
     presenter = UserPresenter()
 
+    # JSON ja serializado por id de usuario, do mesmo app que o repositorio.
+    # Toda rota que alterar um usuario deve atualizar ou remover a entrada
+    # (hoje so o POST grava, e ja grava o JSON novo)
+    user_json = {}
+
     @app.route('/api/health')
     def health():
-        return jsonify({"status": "ok"})
+        return Response(_HEALTH_BODY, mimetype='application/json')
 
     @app.route('/api/users', methods=['POST'])
     def create_user_endpoint():
         data = request.get_json()
         user = create_user.execute(data['name'], data['email'])
-        return jsonify(presenter.to_dict(user)), 201
+        body = _cache_user_json(user_json, user.id, presenter.to_json(user))
+        return Response(body, status=201, mimetype='application/json')
 
     @app.route('/api/users/<int:user_id>')
     def get_user_endpoint(user_id):
         user = get_user.execute(user_id)
         if user is None:
             return jsonify({"error": "User not found"}), 404
-        return jsonify(presenter.to_dict(user))
+        body = user_json.get(user.id)
+        if body is None:
+            body = _cache_user_json(user_json, user.id, presenter.to_json(user))
+        return Response(body, mimetype='application/json')
+
+    # Compila o mapa de rotas agora, e nao na primeira requisicao
+    app.url_map.update()
 
     return app
 '''
 
 CLEAN_FRAMEWORK_WEB_FASTAPI = '''"""Framework web (FastAPI)."""
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import Body, FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, Response
 from src.use_cases.user import CreateUserUseCase, GetUserUseCase
 from src.adapters.repositories.user_repository import InMemoryUserRepository
 from src.adapters.presenters.user_presenter import UserPresenter
 
+# Corpo fixo do health check, serializado uma vez so
+_HEALTH_BODY = b'{"status":"ok"}'
 
-class UserCreateRequest(BaseModel):
-    name: str
-    email: str
+# Maximo de usuarios com JSON em cache por app (os mais antigos saem antes)
+_USER_JSON_MAX = 1024
 
 
-# Dependency injection
-user_repo = InMemoryUserRepository()
-create_user_uc = CreateUserUseCase(user_repo)
-get_user_uc = GetUserUseCase(user_repo)
-presenter = UserPresenter()
+def _cache_user_json(cache: dict, user_id: int, body: bytes) -> bytes:
+    """Guarda o JSON de um usuario, descartando o mais antigo se estiver cheio."""
+    if len(cache) >= _USER_JSON_MAX and user_id not in cache:
+        del cache[next(iter(cache))]
+    cache[user_id] = body
+    return body
 
 
 def create_app() -> FastAPI:
     """Cria a aplicacao FastAPI."""
-    app = FastAPI(title="Clean Architecture API", version="1.0.0")
+    app = FastAPI(
+        title="Clean Architecture API",
+        version="1.0.0",
+        default_response_class=ORJSONResponse,
+    )
+
+    # Dependency injection
+    user_repo = InMemoryUserRepository()
+    create_user_uc = CreateUserUseCase(user_repo)
+    get_user_uc = GetUserUseCase(user_repo)
+    presenter = UserPresenter()
+
+    # JSON ja serializado por id de usuario, do mesmo app que o repositorio.
+    # Toda rota que alterar um usuario deve atualizar ou remover a entrada
+    # (hoje so o POST grava, e ja grava o JSON novo)
+    user_json = {}
 
     @app.get("/api/health")
     async def health():
-        return {"status": "ok"}
+        return Response(_HEALTH_BODY, media_type="application/json")
 
+    # Os casos de uso sao sincronos (e bloqueantes com um banco real):
+    # endpoints "def" rodam no threadpool e nao travam o event loop
     @app.post("/api/users", status_code=201)
-    async def create_user_endpoint(data: UserCreateRequest):
-        user = create_user_uc.execute(data.name, data.email)
-        return presenter.to_dict(user)
+    def create_user_endpoint(name: str = Body(...), email: str = Body(...)):
+        # Os dois campos vem direto do corpo JSON {"name": ..., "email": ...},
+        # sem um model pydantic intermediario
+        user = create_user_uc.execute(name, email)
+        body = _cache_user_json(user_json, user.id, presenter.to_json(user))
+        return Response(body, status_code=201, media_type="application/json")
 
     @app.get("/api/users/{user_id}")
-    async def get_user_endpoint(user_id: int):
+    def get_user_endpoint(user_id: int):
         user = get_user_uc.execute(user_id)
         if user is None:
             raise HTTPException(status_code=404, detail="User not found")
-        return presenter.to_dict(user)
+        body = user_json.get(user.id)
+        if body is None:
+            body = _cache_user_json(user_json, user.id, presenter.to_json(user))
+        return Response(body, media_type="application/json")
 
     return app
 '''
 
 CLEAN_MAIN_FASTAPI = '''"""Ponto de entrada da aplicacao."""
 
+import os
+
 import uvicorn
 from src.frameworks.web.app import create_app
 
 app = create_app()
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    if os.getenv("ENV") == "production":
+        # Varios workers, sem reload; httptools vem com uvicorn[standard] e
+        # loop="auto" usa uvloop quando disponivel (nao existe no Windows)
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+            loop="auto",
+            http="httptools",
+        )
+    else:
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
 '''
 
 CLEAN_TEST_USE_CASE = '''"""Testes dos casos de uso."""
@@ -1072,19 +1095,23 @@ def test_create_user_invalid():
 
 AUTH_USER_MODEL_BASE = '''"""User model for authentication."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 import uuid
 
+# slots=True (Python 3.10+): no per-instance __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class User:
     """User model."""
     username: str
     email: str
     password_hash: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     created_at: datetime = field(default_factory=datetime.utcnow)
     is_active: bool = True
     full_name: Optional[str] = None
@@ -1103,10 +1130,11 @@ class User:
 
 AUTH_PASSWORD_UTILS = '''"""Password hashing utilities."""
 
-from passlib.context import CryptContext
+import secrets
+from functools import lru_cache
+from typing import Optional
 
-# Configure password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
 
 
 def hash_password(password: str) -> str:
@@ -1118,7 +1146,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("ascii")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -1131,7 +1159,26 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
+
+
+@lru_cache(maxsize=None)
+def _dummy_hash() -> str:
+    """Hash of a random password, built on first use (not at import)."""
+    return hash_password(secrets.token_urlsafe(16))
+
+
+def verify_login_password(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """Verify a login password, also when the user does not exist.
+
+    With ``hashed_password=None`` a bcrypt check still runs (against a dummy
+    hash) and False is returned, so the response time does not reveal
+    whether the username is registered.
+    """
+    if hashed_password is None:
+        verify_password(plain_password, _dummy_hash())
+        return False
+    return verify_password(plain_password, hashed_password)
 '''
 
 AUTH_STORAGE_BASE = '''"""In-memory storage for authentication.
@@ -1154,14 +1201,23 @@ class UserStorage:
 
     def create_user(self, user: User) -> User:
         """Create a new user."""
-        if user.username in self._users_by_username:
+        # setdefault checks and claims the key in a single lookup; the
+        # index only grows if the key was free
+        by_username = self._users_by_username
+        by_email = self._users_by_email
+
+        count = len(by_username)
+        by_username.setdefault(user.username, user.id)
+        if len(by_username) == count:
             raise ValueError(f"Username '{user.username}' already exists")
-        if user.email in self._users_by_email:
+
+        count = len(by_email)
+        by_email.setdefault(user.email, user.id)
+        if len(by_email) == count:
+            del by_username[user.username]
             raise ValueError(f"Email '{user.email}' already exists")
 
         self._users[user.id] = user
-        self._users_by_username[user.username] = user.id
-        self._users_by_email[user.email] = user.id
         return user
 
     def get_user_by_id(self, user_id: str) -> Optional[User]:
@@ -1224,11 +1280,26 @@ REFRESH_TOKEN_EXPIRE = timedelta(days=JWT_REFRESH_TOKEN_EXPIRE_DAYS)
 
 JWT_FLASK_UTILS = '''"""JWT token utilities."""
 
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 import jwt
 from .config import JWT_SECRET_KEY, JWT_ALGORITHM, ACCESS_TOKEN_EXPIRE, REFRESH_TOKEN_EXPIRE
 
+# Key material and algorithm list prepared once, not on every encode/decode
+_SIGNING_KEY = JWT_SECRET_KEY.encode("utf-8")
+_ALGORITHMS = [JWT_ALGORITHM]
+
+# Revoked token ids (jti) -> token expiry. In memory, per process: with
+# several workers, move it to a shared store (e.g. Redis)
+_revoked_tokens: Dict[str, float] = {}
+
+# Expired entries are pruned only when the registry reaches this size
+_PRUNE_MIN = 1024
+_prune_at = _PRUNE_MIN
+
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token.
@@ -1247,7 +1318,8 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
         expire = datetime.utcnow() + ACCESS_TOKEN_EXPIRE
 
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    to_encode.setdefault("jti", uuid.uuid4().hex)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
 
@@ -1263,13 +1335,41 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + REFRESH_TOKEN_EXPIRE
     to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    to_encode.setdefault("jti", uuid.uuid4().hex)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
 
+def create_token_pair(data: Dict[str, Any]) -> Tuple[str, str]:
+    """Create an access token and the refresh token issued with it.
+
+    The access token carries the refresh token's jti as ``rjti``, so
+    revoking it at logout revokes the refresh token too.
+
+    Args:
+        data: Data to encode in both tokens
+
+    Returns:
+        (access_token, refresh_token)
+    """
+    refresh_jti = uuid.uuid4().hex
+    refresh_token = create_refresh_token({**data, "jti": refresh_jti})
+    access_token = create_access_token({**data, "rjti": refresh_jti})
+    return access_token, refresh_token
+
+
+@lru_cache(maxsize=4096)
+def _decode_cached(token: str) -> Dict[str, Any]:
+    """Verify signature and claims once per token (invalid tokens are not cached)."""
+    return jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
+
+
 def decode_token(token: str) -> Dict[str, Any]:
     """Decode and verify a JWT token.
 
+    Repeated tokens are served from a per-process cache; the expiry is
+    re-checked on every call, so a cached token still expires on time.
+
     Args:
         token: JWT token to decode
 
@@ -1278,25 +1378,72 @@ def decode_token(token: str) -> Dict[str, Any]:
 
     Raises:
         jwt.ExpiredSignatureError: If token has expired
-        jwt.JWTError: If token is invalid
+        jwt.InvalidTokenError: If token is invalid or revoked
     """
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        return payload
+        payload = _decode_cached(token)
+        exp = payload.get("exp")
+        if exp is not None and exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        if payload.get("jti") in _revoked_tokens:
+            raise jwt.InvalidTokenError("Token has been revoked")
+        return dict(payload)
     except jwt.ExpiredSignatureError:
         raise jwt.ExpiredSignatureError("Token has expired")
-    except jwt.JWTError as e:
-        raise jwt.JWTError(f"Invalid token: {str(e)}")
+    except jwt.InvalidTokenError as e:
+        raise jwt.InvalidTokenError(f"Invalid token: {str(e)}")
+
+
+def revoke_token(payload: Dict[str, Any]) -> None:
+    """Revoke a decoded token (and its paired refresh token) until it expires.
+
+    Args:
+        payload: Token data returned by decode_token
+    """
+    global _prune_at
+    now = time.time()
+
+    jti = payload.get("jti")
+    if jti is not None:
+        _revoked_tokens[jti] = payload.get("exp", now)
+
+    # The refresh token issued with this access token (see create_token_pair);
+    # its exp is not in this payload, so keep it for a full refresh lifetime
+    refresh_jti = payload.get("rjti")
+    if refresh_jti is not None:
+        _revoked_tokens[refresh_jti] = now + REFRESH_TOKEN_EXPIRE.total_seconds()
+
+    # Forget revocations whose tokens have expired anyway, only once the
+    # registry has grown enough for the sweep to be worth it
+    if len(_revoked_tokens) >= _prune_at:
+        for old_jti, old_exp in list(_revoked_tokens.items()):
+            if old_exp <= now:
+                del _revoked_tokens[old_jti]
+        _prune_at = max(_PRUNE_MIN, 2 * len(_revoked_tokens))
 '''
 
 JWT_FLASK_MIDDLEWARE = '''"""JWT authentication middleware."""
 
 from functools import wraps
-from flask import request, jsonify, g
+from flask import Response, request, jsonify, g
 import jwt as pyjwt
 from .utils import decode_token
 from .storage import user_storage
 
+# 401 bodies serialized once; each error only wraps the bytes in a Response
+_ERR_HEADER_FORMAT = b'{"error":"Invalid authorization header format"}'
+_ERR_MISSING = b'{"error":"Authorization token is missing"}'
+_ERR_TOKEN_TYPE = b'{"error":"Invalid token type"}'
+_ERR_USER_NOT_FOUND = b'{"error":"User not found"}'
+_ERR_USER_DISABLED = b'{"error":"User account is disabled"}'
+_ERR_EXPIRED = b'{"error":"Token has expired"}'
+_ERR_INVALID = b'{"error":"Invalid token"}'
+
+
+def _error_response(body: bytes) -> Response:
+    """Build a 401 JSON response from a pre-serialized body."""
+    return Response(body, status=401, mimetype="application/json")
+
 
 def jwt_required(f):
     """Decorator to require JWT authentication.
@@ -1318,10 +1465,10 @@ def jwt_required(f):
             try:
                 token = auth_header.split(" ")[1]  # Bearer <token>
             except IndexError:
-                return jsonify({"error": "Invalid authorization header format"}), 401
+                return _error_response(_ERR_HEADER_FORMAT)
 
         if not token:
-            return jsonify({"error": "Authorization token is missing"}), 401
+            return _error_response(_ERR_MISSING)
 
         try:
             # Decode token
@@ -1329,25 +1476,26 @@ def jwt_required(f):
 
             # Verify token type
             if payload.get('type') != 'access':
-                return jsonify({"error": "Invalid token type"}), 401
+                return _error_response(_ERR_TOKEN_TYPE)
 
             # Get user from storage
             user_id = payload.get('sub')
             user = user_storage.get_user_by_id(user_id)
 
             if not user:
-                return jsonify({"error": "User not found"}), 401
+                return _error_response(_ERR_USER_NOT_FOUND)
 
             if not user.is_active:
-                return jsonify({"error": "User account is disabled"}), 401
+                return _error_response(_ERR_USER_DISABLED)
 
-            # Store user in Flask's g object
+            # Store user (and the token data, used by logout) in Flask's g object
             g.current_user = user
+            g.jwt_payload = payload
 
         except pyjwt.ExpiredSignatureError:
-            return jsonify({"error": "Token has expired"}), 401
-        except pyjwt.JWTError:
-            return jsonify({"error": "Invalid token"}), 401
+            return _error_response(_ERR_EXPIRED)
+        except pyjwt.InvalidTokenError:
+            return _error_response(_ERR_INVALID)
         except Exception as e:
             return jsonify({"error": f"Authentication failed: {str(e)}"}), 401
 
@@ -1367,23 +1515,14 @@ def get_current_user():
 
 JWT_FLASK_ROUTES = '''"""JWT authentication routes."""
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, g
 from .models import User
-from .utils import create_access_token, create_refresh_token, decode_token
-from passlib.context import CryptContext
+from .utils import create_access_token, create_token_pair, decode_token, revoke_token
+from .passwords import hash_password, verify_login_password
 from .storage import user_storage
 from .middleware import jwt_required, get_current_user
 import jwt as pyjwt
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
 
@@ -1405,12 +1544,14 @@ def register():
     if not data:
         return jsonify({"error": "No data provided"}), 400
 
-    username = data.get('username')
-    email = data.get('email')
-    password = data.get('password')
-    full_name = data.get('full_name')
+    try:
+        username, email, password = data['username'], data['email'], data['password']
+        full_name = data.get('full_name')
+    except (KeyError, TypeError, AttributeError):
+        # Missing field or a JSON body that is not an object
+        return jsonify({"error": "Username, email, and password are required"}), 400
 
-    if not username or not email or not password:
+    if not (username and email and password):
         return jsonify({"error": "Username, email, and password are required"}), 400
 
     # Validate password strength
@@ -1429,8 +1570,7 @@ def register():
         user = user_storage.create_user(user)
 
         # Create tokens
-        access_token = create_access_token(data={"sub": user.id})
-        refresh_token = create_refresh_token(data={"sub": user.id})
+        access_token, refresh_token = create_token_pair(data={"sub": user.id})
 
         return jsonify({
             "message": "User created successfully",
@@ -1465,21 +1605,16 @@ def login():
     if not username or not password:
         return jsonify({"error": "Username and password are required"}), 400
 
-    # Get user
+    # Get user and verify password (unknown users cost the same bcrypt check)
     user = user_storage.get_user_by_username(username)
-    if not user:
-        return jsonify({"error": "Invalid username or password"}), 401
-
-    # Verify password
-    if not verify_password(password, user.password_hash):
+    if not verify_login_password(password, user.password_hash if user else None):
         return jsonify({"error": "Invalid username or password"}), 401
 
     if not user.is_active:
         return jsonify({"error": "User account is disabled"}), 401
 
     # Create tokens
-    access_token = create_access_token(data={"sub": user.id})
-    refresh_token = create_refresh_token(data={"sub": user.id})
+    access_token, refresh_token = create_token_pair(data={"sub": user.id})
 
     return jsonify({
         "message": "Login successful",
@@ -1510,7 +1645,7 @@ def refresh():
         return jsonify({"error": "Refresh token is required"}), 400
 
     try:
-        # Decode refresh token
+        # Decode refresh token (revoked ones are rejected by decode_token)
         payload = decode_token(refresh_token)
 
         # Verify token type
@@ -1527,8 +1662,8 @@ def refresh():
         if not user.is_active:
             return jsonify({"error": "User account is disabled"}), 401
 
-        # Create new access token
-        access_token = create_access_token(data={"sub": user.id})
+        # Create new access token, still paired with this refresh token
+        access_token = create_access_token(data={"sub": user.id, "rjti": payload.get("jti")})
 
         return jsonify({
             "access_token": access_token,
@@ -1537,7 +1672,7 @@ def refresh():
 
     except pyjwt.ExpiredSignatureError:
         return jsonify({"error": "Refresh token has expired"}), 401
-    except pyjwt.JWTError:
+    except pyjwt.InvalidTokenError:
         return jsonify({"error": "Invalid refresh token"}), 401
 
 
@@ -1552,11 +1687,11 @@ def get_current_user_info():
 @auth_bp.route('/logout', methods=['POST'])
 @jwt_required
 def logout():
-    """Logout user (client should delete tokens).
+    """Logout user: the access token used here and its refresh token are revoked.
 
-    Note: With JWT, logout is primarily handled client-side by deleting tokens.
-    This endpoint is provided for consistency and can be extended with token blacklisting.
+    The client should still delete its tokens.
     """
+    revoke_token(g.jwt_payload)
     return jsonify({"message": "Logout successful. Please delete your tokens."}), 200
 '''
 
@@ -1636,7 +1771,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has expired"
         )
-    except pyjwt.JWTError:
+    except pyjwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
@@ -1663,21 +1798,14 @@ JWT_FASTAPI_ROUTES = '''"""JWT authentication routes for FastAPI."""
 from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
+from fastapi.concurrency import run_in_threadpool
 import jwt as pyjwt
-from passlib.context import CryptContext
 from .models import User
-from .utils import create_access_token, create_refresh_token, decode_token
+from fastapi.security import HTTPAuthorizationCredentials
+from .utils import create_access_token, create_token_pair, decode_token, revoke_token
+from .passwords import hash_password, verify_login_password
 from .storage import user_storage
-from .dependencies import get_current_user
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+from .dependencies import get_current_user, security
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -1731,8 +1859,8 @@ class AuthResponse(BaseModel):
 async def register(user_data: UserRegister):
     """Register a new user."""
     try:
-        # Create user
-        password_hash = hash_password(user_data.password)
+        # Create user (bcrypt runs in the threadpool, off the event loop)
+        password_hash = await run_in_threadpool(hash_password, user_data.password)
         user = User(
             username=user_data.username,
             email=user_data.email,
@@ -1742,8 +1870,7 @@ async def register(user_data: UserRegister):
         user = user_storage.create_user(user)
 
         # Create tokens
-        access_token = create_access_token(data={"sub": user.id})
-        refresh_token = create_refresh_token(data={"sub": user.id})
+        access_token, refresh_token = create_token_pair(data={"sub": user.id})
 
         return AuthResponse(
             message="User created successfully",
@@ -1762,16 +1889,11 @@ async def register(user_data: UserRegister):
 @router.post("/login", response_model=AuthResponse)
 async def login(credentials: UserLogin):
     """Login user and return JWT tokens."""
-    # Get user
+    # Get user and verify password; bcrypt runs in the threadpool, off the
+    # event loop, and unknown users cost the same bcrypt check
     user = user_storage.get_user_by_username(credentials.username)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid username or password"
-        )
-
-    # Verify password
-    if not verify_password(credentials.password, user.password_hash):
+    password_hash = user.password_hash if user else None
+    if not await run_in_threadpool(verify_login_password, credentials.password, password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password"
@@ -1784,8 +1906,7 @@ async def login(credentials: UserLogin):
         )
 
     # Create tokens
-    access_token = create_access_token(data={"sub": user.id})
-    refresh_token = create_refresh_token(data={"sub": user.id})
+    access_token, refresh_token = create_token_pair(data={"sub": user.id})
 
     return AuthResponse(
         message="Login successful",
@@ -1799,7 +1920,7 @@ async def login(credentials: UserLogin):
 async def refresh(token_data: TokenRefresh):
     """Refresh access token using refresh token."""
     try:
-        # Decode refresh token
+        # Decode refresh token (revoked ones are rejected by decode_token)
         payload = decode_token(token_data.refresh_token)
 
         # Verify token type
@@ -1825,8 +1946,8 @@ async def refresh(token_data: TokenRefresh):
                 detail="User account is disabled"
             )
 
-        # Create new access token
-        access_token = create_access_token(data={"sub": user.id})
+        # Create new access token, still paired with this refresh token
+        access_token = create_access_token(data={"sub": user.id, "rjti": payload.get("jti")})
 
         return TokenResponse(access_token=access_token)
 
@@ -1835,7 +1956,7 @@ async def refresh(token_data: TokenRefresh):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token has expired"
         )
-    except pyjwt.JWTError:
+    except pyjwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token"
@@ -1849,8 +1970,16 @@ async def get_me(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
-    """Logout user (client should delete tokens)."""
+async def logout(
+    current_user: User = Depends(get_current_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    """Logout user: the access token used here and its refresh token are revoked.
+
+    The client should still delete its tokens.
+    """
+    # Already verified by get_current_user; served from the decode cache
+    revoke_token(decode_token(credentials.credentials))
     return {"message": "Logout successful. Please delete your tokens."}
 '''
 
@@ -1872,20 +2001,11 @@ __all__ = ['router', 'get_current_user', 'get_current_active_user', 'User', 'use
 JWT_TESTS = '''"""Tests for JWT authentication."""
 
 import pytest
-from passlib.context import CryptContext
 from app.auth.models import User
+from app.auth.passwords import hash_password, verify_password
 from app.auth.utils import create_access_token, decode_token
 from app.auth.storage import UserStorage
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
 
 def test_password_hashing():
     """Test password hashing and verification."""
@@ -2007,20 +2127,17 @@ SESSION_FLASK_UTILS = '''"""Session utilities for Flask."""
 
 from flask import session
 from typing import Optional
-from passlib.context import CryptContext
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("ascii")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
 
 
 def create_session(user_id: str, username: str) -> None:
@@ -2225,21 +2342,18 @@ SESSION_FASTAPI_UTILS = '''"""Session utilities for FastAPI."""
 
 from starlette.requests import Request
 from typing import Optional
-from passlib.context import CryptContext
+import bcrypt
 import secrets
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("ascii")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
 
 
 def create_session_token() -> str:
@@ -2450,18 +2564,9 @@ __all__ = ['router', 'get_current_user', 'get_current_active_user', 'User', 'use
 SESSION_TESTS = '''"""Tests for Session authentication."""
 
 import pytest
-from passlib.context import CryptContext
 from app.auth.models import User
 from app.auth.storage import UserStorage
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+from app.auth.utils import hash_password, verify_password
 
 
 def test_password_hashing():
@@ -2522,20 +2627,17 @@ BASIC_AUTH_FORCE = os.getenv('BASIC_AUTH_FORCE', 'True').lower() == 'true'
 
 BASIC_FLASK_UTILS = '''"""Basic authentication utilities."""
 
-from passlib.context import CryptContext
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("ascii")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
 '''
 
 BASIC_FLASK_MIDDLEWARE = '''"""Basic authentication middleware for Flask."""
@@ -2691,12 +2793,11 @@ BASIC_FASTAPI_DEPENDENCIES = '''"""Basic authentication dependencies for FastAPI
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from passlib.context import CryptContext
 from .storage import user_storage
 from .models import User
+from .utils import verify_password
 
 security = HTTPBasic()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 async def get_current_user(credentials: HTTPBasicCredentials = Depends(security)) -> User:
@@ -2716,7 +2817,7 @@ async def get_current_user(credentials: HTTPBasicCredentials = Depends(security)
             headers={"WWW-Authenticate": "Basic"},
         )
 
-    if not pwd_context.verify(credentials.password, user.password_hash):
+    if not verify_password(credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
@@ -2738,13 +2839,12 @@ BASIC_FASTAPI_ROUTES = '''"""Basic authentication routes for FastAPI."""
 from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
-from passlib.context import CryptContext
 from .models import User
 from .storage import user_storage
 from .dependencies import get_current_user
+from .utils import hash_password
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 class UserRegister(BaseModel):
@@ -2769,7 +2869,7 @@ async def register(user_data: UserRegister):
     """Register a new user."""
     try:
         # Create user
-        password_hash = pwd_context.hash(user_data.password)
+        password_hash = hash_password(user_data.password)
         user = User(
             username=user_data.username,
             email=user_data.email,
@@ -2806,18 +2906,16 @@ __all__ = ['router', 'get_current_user', 'User', 'user_storage']
 BASIC_TESTS = '''"""Tests for Basic authentication."""
 
 import pytest
-from passlib.context import CryptContext
 from app.auth.models import User
 from app.auth.storage import UserStorage
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.auth.utils import hash_password
 
 def test_user_creation():
     """Test user model creation."""
     user = User(
         username="testuser",
         email="test@example.com",
-        password_hash=pwd_context.hash("password123")
+        password_hash=hash_password("password123")
     )
 
     assert user.username == "testuser"
@@ -2928,11 +3026,10 @@ from .models import User
 from .storage import user_storage
 from .middleware import oauth_required, get_current_user
 from .utils import oauth
-from passlib.context import CryptContext
+import bcrypt
 import secrets
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 @auth_bp.route('/login')
@@ -2961,7 +3058,7 @@ def callback():
             user = User(
                 username=username,
                 email=email,
-                password_hash=pwd_context.hash(secrets.token_urlsafe(32)),  # Random password
+                password_hash=bcrypt.hashpw(secrets.token_bytes(32), bcrypt.gensalt()).decode("ascii"),  # Random password
                 full_name=full_name
             )
             user = user_storage.create_user(user)
@@ -3083,7 +3180,7 @@ from fastapi import APIRouter, HTTPException, status, Depends, Request
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
 from typing import Optional
-from passlib.context import CryptContext
+import bcrypt
 import secrets
 from .models import User
 from .storage import user_storage
@@ -3091,7 +3188,6 @@ from .dependencies import get_current_user
 from .utils import oauth
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 class UserResponse(BaseModel):
@@ -3135,7 +3231,7 @@ async def callback(request: Request):
             user = User(
                 username=username,
                 email=email,
-                password_hash=pwd_context.hash(secrets.token_urlsafe(32)),  # Random password
+                password_hash=bcrypt.hashpw(secrets.token_bytes(32), bcrypt.gensalt()).decode("ascii"),  # Random password
                 full_name=full_name
             )
             user = user_storage.create_user(user)
@@ -3207,20 +3303,28 @@ def test_user_storage():
 # FUNCOES DE CRIACAO
 # =============================================================================
 
-def _create_dirs_and_files(project_path, directories, files, verbose=False):
-    """Helper para criar diretorios e arquivos."""
-    project_path = Path(project_path)
+def _create_dirs_and_files(project_path, directories, files, verbose=False, batch=None):
+    """Helper para criar diretorios e arquivos.
 
-    for dir_name in directories:
-        dir_path = project_path / dir_name
-        dir_path.mkdir(parents=True, exist_ok=True)
-        if verbose:
-            print_creating('dir', dir_name)
+    Se ``batch`` (FSBatch) for passado, so agenda as operacoes nele; quem
+    criou o batch faz o commit. Sem batch, cria e grava tudo de uma vez.
+    """
+    own_batch = batch is None
+    if own_batch:
+        batch = FSBatch(project_path)
 
+    for dir_name in directories:
+        batch.mkdir(dir_name)
     for file_name, content in files.items():
-        file_path = project_path / file_name
-        file_path.write_text(content, encoding='utf-8')
-        if verbose:
+        batch.write(file_name, content)
+
+    if own_batch:
+        batch.commit()
+
+    if verbose:
+        for dir_name in directories:
+            print_creating('dir', dir_name)
+        for file_name in files:
             print_creating('file', file_name)
 
 
@@ -3244,6 +3348,7 @@ def get_jwt_auth_files(project_type):
         'app/auth/models.py': AUTH_USER_MODEL_BASE,
         'app/auth/storage.py': AUTH_STORAGE_BASE,
         'app/auth/utils.py': JWT_FLASK_UTILS if is_flask else JWT_FASTAPI_UTILS,
+        'app/auth/passwords.py': AUTH_PASSWORD_UTILS,
         'app/auth/config.py': JWT_FLASK_CONFIG,
         'tests/auth/__init__.py': '',
         'tests/auth/test_auth.py': JWT_TESTS,
@@ -3392,7 +3497,7 @@ def get_auth_directories(auth_type):
     return ['app/auth', 'tests/auth']
 
 
-def create_mvc_structure(project_path, project_type, auth_type='none', verbose=False):
+def create_mvc_structure(project_path, project_type, auth_type='none', verbose=False, batch=None):
     """Cria a estrutura de pastas MVC para um projeto."""
     project_path = Path(project_path)
 
@@ -3464,7 +3569,7 @@ def create_mvc_structure(project_path, project_type, auth_type='none', verbose=F
     auth_files = get_auth_files(auth_type, project_type)
     files.update(auth_files)
 
-    _create_dirs_and_files(project_path, directories, files, verbose)
+    _create_dirs_and_files(project_path, directories, files, verbose, batch)
 
     if verbose:
         print_success(t('structure_mvc_created'))
@@ -3472,7 +3577,7 @@ def create_mvc_structure(project_path, project_type, auth_type='none', verbose=F
     return True
 
 
-def create_api_structure(project_path, project_type, auth_type='none', verbose=False):
+def create_api_structure(project_path, project_type, auth_type='none', verbose=False, batch=None):
     """Create REST API structure."""
     project_path = Path(project_path)
 
@@ -3530,7 +3635,7 @@ def create_api_structure(project_path, project_type, auth_type='none', verbose=F
     auth_files = get_auth_files(auth_type, project_type)
     files.update(auth_files)
 
-    _create_dirs_and_files(project_path, directories, files, verbose)
+    _create_dirs_and_files(project_path, directories, files, verbose, batch)
 
     if verbose:
         print_success(t('structure_api_created'))
@@ -3538,8 +3643,12 @@ def create_api_structure(project_path, project_type, auth_type='none', verbose=F
     return True
 
 
-def create_cli_structure(project_path, verbose=False):
-    """Create CLI project structure."""
+def create_cli_structure(project_path, verbose=False, batch=None, auth_type='none'):
+    """Create CLI project structure.
+
+    ``auth_type`` is accepted for a uniform signature with the other
+    builders and ignored: CLI projects have no authentication.
+    """
     project_path = Path(project_path)
     project_name = project_path.name
 
@@ -3568,7 +3677,7 @@ def create_cli_structure(project_path, verbose=False):
         'README.md': f'# {project_name}\n\nCLI criado com Prozees.\n\n## Setup\n\n```bash\npip install -e .\ncp .env.example .env\n```\n\n## Uso\n\n```bash\n{project_name} --help\n{project_name} hello\n{project_name} greet Mundo\n```\n\n## Testes\n\n```bash\npytest\n```\n',
     }
 
-    _create_dirs_and_files(project_path, directories, files, verbose)
+    _create_dirs_and_files(project_path, directories, files, verbose, batch)
 
     if verbose:
         print_success(t('structure_cli_created'))
@@ -3576,7 +3685,7 @@ def create_cli_structure(project_path, verbose=False):
     return True
 
 
-def create_clean_structure(project_path, project_type, auth_type='none', verbose=False):
+def create_clean_structure(project_path, project_type, auth_type='none', verbose=False, batch=None):
     """Create Clean Architecture structure."""
     project_path = Path(project_path)
 
@@ -3651,9 +3760,95 @@ def create_clean_structure(project_path, project_type, auth_type='none', verbose
                 auth_files[path] = content
         files.update(auth_files)
 
-    _create_dirs_and_files(project_path, directories, files, verbose)
+    _create_dirs_and_files(project_path, directories, files, verbose, batch)
 
     if verbose:
         print_success(t('structure_clean_created'))
 
     return True
+
+
+# =============================================================================
+# BUILT-IN TEMPLATES REGISTRY
+# =============================================================================
+
+class TplInfo(NamedTuple):
+    """Template built-in: metadados + funcao que cria a estrutura.
+
+    ``function`` e chamada como
+    ``function(project_path, verbose=..., auth_type=..., batch=...)``; o tipo
+    de projeto ja vem ligado via ``functools.partial``, entao os demais
+    argumentos vao por nome. O template ``cli`` aceita e ignora ``auth_type``.
+    """
+    name: str
+    display_name: str
+    description: str
+    function: Callable
+
+
+BUILTIN_TEMPLATES = {
+    'mvc-flask': TplInfo(
+        'mvc-flask',
+        'MVC com Flask',
+        'Arquitetura MVC com Flask',
+        partial(create_mvc_structure, project_type='web-flask'),
+    ),
+    'mvc-fastapi': TplInfo(
+        'mvc-fastapi',
+        'MVC com FastAPI',
+        'Arquitetura MVC com FastAPI',
+        partial(create_mvc_structure, project_type='web-fastapi'),
+    ),
+    'api-flask': TplInfo(
+        'api-flask',
+        'API REST com Flask',
+        'API REST com Flask',
+        partial(create_api_structure, project_type='api-flask'),
+    ),
+    'api-fastapi': TplInfo(
+        'api-fastapi',
+        'API REST com FastAPI',
+        'API REST com FastAPI',
+        partial(create_api_structure, project_type='api-fastapi'),
+    ),
+    'cli': TplInfo(
+        'cli',
+        'CLI com Click',
+        'Aplicação CLI com Click',
+        partial(create_cli_structure),
+    ),
+    'clean-flask': TplInfo(
+        'clean-flask',
+        'Clean Architecture com Flask',
+        'Clean Architecture com Flask',
+        partial(create_clean_structure, project_type='clean-flask'),
+    ),
+    'clean-fastapi': TplInfo(
+        'clean-fastapi',
+        'Clean Architecture com FastAPI',
+        'Clean Architecture com FastAPI',
+        partial(create_clean_structure, project_type='clean-fastapi'),
+    ),
+}
+
+
+# Lista de exibicao, montada uma vez: o registro nao muda durante o processo
+_BUILTIN_TEMPLATE_LIST = tuple(
+    {
+        'name': tpl.name,
+        'display_name': tpl.display_name,
+        'description': tpl.description,
+    }
+    for tpl in BUILTIN_TEMPLATES.values()
+)
+
+
+def get_builtin_template_list():
+    """Retorna lista de templates built-in para exibição.
+
+    O resultado e compartilhado entre chamadas; nao modifique.
+
+    Returns:
+        Tuple of dicts with template info
+    """
+    return _BUILTIN_TEMPLATE_LIST
@@ -1,12 +1,13 @@
 """Module for managing custom templates."""
 
 import json
+import os
 import re
 import shutil
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from prozes.modules.console import console, print_error, print_success, print_info
 from prozes.modules.i18n import t
@@ -20,6 +21,8 @@ TEMPLATE_VERSION = "1.0"
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 WARN_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 VARIABLE_PATTERN = re.compile(r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)\}\}')
+TEMPLATE_NAME_START_PATTERN = re.compile(r'[a-zA-Z_]')
+TEMPLATE_NAME_PATTERN = re.compile(r'[a-zA-Z_][a-zA-Z0-9_-]*\Z')
 
 DEFAULT_TEXT_EXTENSIONS = {
     '.py', '.txt', '.md', '.json', '.toml', '.yaml', '.yml',
@@ -27,6 +30,9 @@ DEFAULT_TEXT_EXTENSIONS = {
     '.sh', '.bat', '.ps1', '.xml', '.env', '.gitignore'
 }
 
+# Templates directory, resolved once at import
+_TEMPLATE_ROOT = Path.home() / '.prozes' / 'templates'
+
 DEFAULT_EXCLUDE_DIRS = {
     '__pycache__', '.git', 'venv', '.venv', 'env', '.env',
     'node_modules', '.pytest_cache', '.mypy_cache', '.tox',
@@ -276,14 +282,7 @@ class Template:
         Returns:
             List of relative paths to files
         """
-        structure_path = self.get_structure_path()
-        files = []
-
-        for item in structure_path.rglob('*'):
-            if item.is_file():
-                files.append(item.relative_to(structure_path))
-
-        return sorted(files)
+        return sorted(relative for relative, _ in _iter_files(self.get_structure_path()))
 
 
 # =============================================================================
@@ -295,9 +294,30 @@ def get_templates_directory() -> Path:
 
     Creates directory if it doesn't exist.
     """
-    templates_dir = Path.home() / '.prozes' / 'templates'
-    templates_dir.mkdir(parents=True, exist_ok=True)
-    return templates_dir
+    _TEMPLATE_ROOT.mkdir(parents=True, exist_ok=True)
+    return _TEMPLATE_ROOT
+
+
+def iter_custom_templates() -> Iterator[Template]:
+    """Iterate over custom templates, sorted by name.
+
+    The templates directory is read with a single ``os.scandir``; each
+    template.json is only loaded when the iterator reaches it.
+
+    Yields:
+        Template objects (invalid templates are skipped with a warning)
+    """
+    templates_dir = get_templates_directory()
+
+    with os.scandir(templates_dir) as entries:
+        names = sorted(entry.name for entry in entries if entry.is_dir())
+
+    for name in names:
+        try:
+            yield Template.load(name)
+        except (FileNotFoundError, ValueError) as e:
+            # Skip invalid templates
+            console.print(f"[yellow]Warning: Skipping invalid template '{name}': {e}[/yellow]")
 
 
 def list_custom_templates() -> List[Template]:
@@ -306,19 +326,7 @@ def list_custom_templates() -> List[Template]:
     Returns:
         List of Template objects
     """
-    templates_dir = get_templates_directory()
-    templates = []
-
-    for item in templates_dir.iterdir():
-        if item.is_dir():
-            try:
-                template = Template.load(item.name)
-                templates.append(template)
-            except (FileNotFoundError, ValueError) as e:
-                # Skip invalid templates
-                console.print(f"[yellow]Warning: Skipping invalid template '{item.name}': {e}[/yellow]")
-
-    return sorted(templates, key=lambda t: t.name)
+    return list(iter_custom_templates())
 
 
 def template_exists(name: str) -> bool:
@@ -353,6 +361,44 @@ def get_template(name: str) -> Optional[Template]:
 # SCANNING FUNCTIONS
 # =============================================================================
 
+def _iter_files(
+    root: Path,
+    exclude: Optional[Set[str]] = None
+) -> Iterator[Tuple[Path, Path]]:
+    """Walk ``root`` with ``os.scandir`` and yield its regular files.
+
+    Uses the type information cached in each DirEntry, so no extra
+    ``stat()`` is issued per entry. Like ``rglob``, symlinked directories
+    are not followed and unreadable directories are skipped.
+
+    Args:
+        root: Directory to walk
+        exclude: File/directory names to prune from the walk
+
+    Yields:
+        Tuples of (path relative to root, absolute path)
+    """
+    stack = [('', os.fspath(root))]
+
+    while stack:
+        prefix, current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if exclude and entry.name in exclude:
+                    continue
+
+                relative = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((relative + os.sep, entry.path))
+                elif entry.is_file():
+                    yield Path(relative), Path(entry.path)
+
+
 def detect_file_type(file_path: Path) -> str:
     """Detect if file is text, binary, or should be skipped.
 
@@ -455,31 +501,26 @@ def scan_project_structure(
     binary_files = []
     detected_variables = set()
 
-    for item in source_path.rglob('*'):
-        # Skip excluded directories
-        if any(excluded in item.parts for excluded in exclude_dirs):
-            continue
-
-        if item.is_file():
-            relative_path = item.relative_to(source_path)
-            files.append(relative_path)
+    # Excluded directories are pruned during the walk
+    for relative_path, item in _iter_files(source_path, exclude_dirs):
+        files.append(relative_path)
 
-            # Detect file type
-            file_type = detect_file_type(item)
+        # Detect file type
+        file_type = detect_file_type(item)
 
-            if file_type == 'text':
-                text_files.append(relative_path)
+        if file_type == 'text':
+            text_files.append(relative_path)
 
-                # Try to detect variables
-                try:
-                    content = item.read_text(encoding='utf-8')
-                    variables = detect_variables_in_file(content)
-                    detected_variables.update(variables)
-                except Exception:
-                    pass
+            # Try to detect variables
+            try:
+                content = item.read_text(encoding='utf-8')
+                variables = detect_variables_in_file(content)
+                detected_variables.update(variables)
+            except Exception:
+                pass
 
-            elif file_type == 'binary':
-                binary_files.append(relative_path)
+        elif file_type == 'binary':
+            binary_files.append(relative_path)
 
     return {
         'files': files,
@@ -507,10 +548,10 @@ def validate_template_name(name: str) -> Tuple[bool, Optional[str]]:
         return False, "Template name cannot be empty"
 
     # Same rules as project name
-    if not re.match(r"^[a-zA-Z_]", name):
+    if not TEMPLATE_NAME_START_PATTERN.match(name):
         return False, "Template name must start with a letter or underscore"
 
-    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_-]*$", name):
+    if not TEMPLATE_NAME_PATTERN.match(name):
         return False, "Template name can only contain letters, numbers, underscores, and hyphens"
 
     return True, None
@@ -693,7 +734,8 @@ def apply_template(
     project_name: str,
     variables: Dict[str, Any],
     destination: Optional[Path] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    check_exists: bool = True
 ) -> Path:
     """Apply template to create new project.
 
@@ -703,6 +745,8 @@ def apply_template(
         variables: Variable values
         destination: Destination directory (default: current dir)
         verbose: Verbose output
+        check_exists: Fail if the project directory exists; pass False when
+            the caller has already checked it
 
     Returns:
         Path to created project
@@ -717,7 +761,7 @@ def apply_template(
     project_path = destination / project_name
 
     # Validate project doesn't exist
-    if project_path.exists():
+    if check_exists and project_path.exists():
         raise ValueError(f"Project directory already exists: {project_path}")
 
     # Add built-in variables
@@ -755,44 +799,41 @@ def apply_template(
     # Copy and process files
     structure_path = template.get_structure_path()
 
-    for source_file in structure_path.rglob('*'):
-        if source_file.is_file():
-            relative_path = source_file.relative_to(structure_path)
-
-            # Substitute variables in filename
-            new_path_str = str(relative_path)
-            for var_name, var_value in all_variables.items():
-                new_path_str = new_path_str.replace(f'{{{{{var_name}}}}}', str(var_value))
+    for relative_path, source_file in _iter_files(structure_path):
+        # Substitute variables in filename
+        new_path_str = str(relative_path)
+        for var_name, var_value in all_variables.items():
+            new_path_str = new_path_str.replace(f'{{{{{var_name}}}}}', str(var_value))
 
-            dest_file = project_path / new_path_str
-            dest_file.parent.mkdir(parents=True, exist_ok=True)
+        dest_file = project_path / new_path_str
+        dest_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Detect file type
-            file_type = detect_file_type(source_file)
+        # Detect file type
+        file_type = detect_file_type(source_file)
 
-            if file_type == 'text':
-                # Read, substitute, and write
-                try:
-                    content = source_file.read_text(encoding='utf-8')
+        if file_type == 'text':
+            # Read, substitute, and write
+            try:
+                content = source_file.read_text(encoding='utf-8')
 
-                    if verbose:
-                        print_info(t('substituting_variables'))
+                if verbose:
+                    print_info(t('substituting_variables'))
 
-                    # Substitute variables
-                    content = substitute_variables(content, all_variables)
+                # Substitute variables
+                content = substitute_variables(content, all_variables)
 
-                    dest_file.write_text(content, encoding='utf-8')
+                dest_file.write_text(content, encoding='utf-8')
 
-                except Exception as e:
-                    console.print(f"[yellow]Warning: Failed to process {relative_path}: {e}[/yellow]")
-                    # Fallback to binary copy
-                    shutil.copy2(source_file, dest_file)
-            else:
-                # Binary copy
+            except Exception as e:
+                console.print(f"[yellow]Warning: Failed to process {relative_path}: {e}[/yellow]")
+                # Fallback to binary copy
                 shutil.copy2(source_file, dest_file)
+        else:
+            # Binary copy
+            shutil.copy2(source_file, dest_file)
 
-            if verbose:
-                console.print(f"  Created: {new_path_str}")
+        if verbose:
+            console.print(f"  Created: {new_path_str}")
 
     return project_path
 
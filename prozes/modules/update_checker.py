@@ -9,6 +9,13 @@ import urllib.request
 import urllib.error
 from packaging import version
 
+# Minimum interval between two PyPI checks (one day)
+UPDATE_CHECK_INTERVAL = 86400
+
+# Cache location, resolved once at import
+_CACHE_DIR = Path.home() / '.prozes'
+_CACHE_FILE = _CACHE_DIR / 'update_check_cache'
+
 
 def get_current_version() -> str:
     """Get the current installed version of Prozes.
@@ -65,29 +72,28 @@ def get_cache_file() -> Path:
     Returns:
         Path to cache file
     """
-    cache_dir = Path.home() / '.prozes'
-    cache_dir.mkdir(exist_ok=True)
-    return cache_dir / 'update_check_cache'
+    _CACHE_DIR.mkdir(exist_ok=True)
+    return _CACHE_FILE
 
 
-def should_check_update() -> bool:
+def should_check_update(min_interval: float = UPDATE_CHECK_INTERVAL) -> bool:
     """Check if we should check for updates (once per day).
 
+    Uses the cache file's mtime, so the decision costs a single stat.
+
+    Args:
+        min_interval: Minimum number of seconds between two checks
+
     Returns:
         True if should check, False otherwise
     """
-    cache_file = get_cache_file()
-
-    if not cache_file.exists():
-        return True
-
     try:
-        last_check = float(cache_file.read_text().strip())
-        # Check once per day (86400 seconds)
-        return (time.time() - last_check) > 86400
-    except (ValueError, FileNotFoundError):
+        last_check = get_cache_file().stat().st_mtime
+    except OSError:
         return True
 
+    return (time.time() - last_check) > min_interval
+
 
 def update_cache():
     """Update the cache file with current timestamp."""
@@ -111,9 +117,9 @@ def check_for_updates(verbose: bool = False) -> Tuple[bool, Optional[str]]:
     # Check for updates
     is_available, latest_version = is_update_available()
 
-    # Update cache
-    if is_available or latest_version is not None:
-        update_cache()
+    # Update cache even when PyPI could not be reached, so offline runs
+    # don't wait for the request timeout on every invocation
+    update_cache()
 
     return is_available, latest_version
 
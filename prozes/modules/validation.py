@@ -5,7 +5,51 @@ import shutil
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from prozes.modules.i18n import t
+from prozes.modules.i18n import t, t_map
+
+# Patterns compiled once at import
+_NAME_START_RE = re.compile(r"[a-zA-Z_]")
+_NAME_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*\Z")
+_PYTHON_VERSION_RE = re.compile(r"\d+(\.\d+)?\Z")
+
+# Python reserved keywords
+_PYTHON_KEYWORDS = frozenset({
+    "False",
+    "None",
+    "True",
+    "and",
+    "as",
+    "assert",
+    "async",
+    "await",
+    "break",
+    "class",
+    "continue",
+    "def",
+    "del",
+    "elif",
+    "else",
+    "except",
+    "finally",
+    "for",
+    "from",
+    "global",
+    "if",
+    "import",
+    "in",
+    "is",
+    "lambda",
+    "nonlocal",
+    "not",
+    "or",
+    "pass",
+    "raise",
+    "return",
+    "try",
+    "while",
+    "with",
+    "yield",
+})
 
 
 class ValidationError(Exception):
@@ -22,54 +66,15 @@ def validate_project_name(name: str) -> Tuple[bool, Optional[str]]:
         return False, t("validation_name_empty")
 
     # Check if it starts with a letter or underscore
-    if not re.match(r"^[a-zA-Z_]", name):
+    if not _NAME_START_RE.match(name):
         return False, t("validation_name_start")
 
     # Check if it contains only valid characters
-    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", name):
+    if not _NAME_RE.match(name):
         return False, t("validation_name_chars")
 
-    # Python reserved keywords
-    keywords = {
-        "False",
-        "None",
-        "True",
-        "and",
-        "as",
-        "assert",
-        "async",
-        "await",
-        "break",
-        "class",
-        "continue",
-        "def",
-        "del",
-        "elif",
-        "else",
-        "except",
-        "finally",
-        "for",
-        "from",
-        "global",
-        "if",
-        "import",
-        "in",
-        "is",
-        "lambda",
-        "nonlocal",
-        "not",
-        "or",
-        "pass",
-        "raise",
-        "return",
-        "try",
-        "while",
-        "with",
-        "yield",
-    }
-
-    if name in keywords:
-        return False, t("validation_name_keyword", name=name)
+    if name in _PYTHON_KEYWORDS:
+        return False, t_map("validation_name_keyword", {"name": name})
 
     return True, None
 
@@ -78,7 +83,7 @@ def validate_project_not_exists(name: str) -> Tuple[bool, Optional[str]]:
     """Verifica se já não existe uma pasta com esse nome."""
     project_path = Path.cwd() / name
     if project_path.exists():
-        return False, t("validation_project_exists", name=name)
+        return False, t_map("validation_project_exists", {"name": name})
     return True, None
 
 
@@ -88,8 +93,8 @@ def validate_python_version(version: Optional[str]) -> Tuple[bool, Optional[str]
         return True, None
 
     # Valid format: single digit (3) or major.minor (3.8, 3.11)
-    if not re.match(r"^\d+(\.\d+)?$", version):
-        return False, t("validation_python_version_format", version=version)
+    if not _PYTHON_VERSION_RE.match(version):
+        return False, t_map("validation_python_version_format", {"version": version})
 
     return True, None
 
@@ -54,15 +54,25 @@ def criar_venv(caminho_projeto, versao_python=None, verbose=False):
     if verbose:
         click.echo(f"[*] Usando Python: {python_exec}")
 
-    resultado = subprocess.run(
-        [python_exec, "-m", "venv", str(venv_path)],
-        capture_output=True,
-        text=True
-    )
+    if python_exec == sys.executable:
+        # Mesmo interpretador: cria o venv no proprio processo, sem subir
+        # outro Python so pra rodar `-m venv`.
+        import venv
+
+        try:
+            venv.EnvBuilder(with_pip=True, symlinks=(os.name != 'nt')).create(str(venv_path))
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise RuntimeError(f"Falha ao criar venv: {e}") from e
+    else:
+        resultado = subprocess.run(
+            [python_exec, "-m", "venv", str(venv_path)],
+            capture_output=True,
+            text=True
+        )
 
-    if resultado.returncode != 0:
-        erro = resultado.stderr or "Erro desconhecido ao criar venv"
-        raise RuntimeError(f"Falha ao criar venv: {erro}")
+        if resultado.returncode != 0:
+            erro = resultado.stderr or "Erro desconhecido ao criar venv"
+            raise RuntimeError(f"Falha ao criar venv: {erro}")
 
     if verbose:
         click.echo("[OK] Ambiente virtual criado com sucesso")
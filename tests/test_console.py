@@ -0,0 +1,39 @@
+"""Tests for prozes.modules.console."""
+
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+
+from prozes.modules import console as console_module
+from prozes.modules.i18n import t
+
+
+@pytest.fixture
+def output(monkeypatch):
+    """Route the module console into a recording console."""
+    recorder = Console(record=True, width=120, color_system=None)
+    monkeypatch.setattr(console_module, 'console', recorder)
+    return recorder
+
+
+def _template(name):
+    metadata = SimpleNamespace(description='desc', author='', created_at='')
+    return SimpleNamespace(name=name, metadata=metadata)
+
+
+def test_template_list_counts_streamed_templates(output):
+    templates = (_template(name) for name in ('one', 'two', 'three'))
+    console_module.print_template_list(templates)
+
+    text = output.export_text()
+    assert f"{t('custom_templates')} (3)" in text
+    assert text.index('three') < text.index('(3)')
+
+
+def test_template_list_without_custom_templates(output):
+    console_module.print_template_list(iter(()))
+
+    text = output.export_text()
+    assert t('no_custom_templates') in text
+    assert '(0)' not in text
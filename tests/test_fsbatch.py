@@ -0,0 +1,70 @@
+"""Tests for prozes.modules.fsbatch."""
+
+import os
+
+from prozes.modules.fsbatch import FSBatch
+
+
+def test_nothing_is_written_before_commit(tmp_path):
+    root = tmp_path / 'project'
+    batch = FSBatch(root)
+    batch.mkdir('src')
+    batch.write('README.md', 'hello')
+
+    assert not root.exists()
+
+
+def test_nested_dirs_are_created(tmp_path):
+    batch = FSBatch(tmp_path / 'project')
+    batch.mkdir('app')
+    batch.mkdir('app/models')
+    batch.mkdir('app/models/domain')
+    batch.mkdir('tests')
+    batch.commit()
+
+    for relative in ('app', 'app/models', 'app/models/domain', 'tests'):
+        assert (tmp_path / 'project' / relative).is_dir()
+
+
+def test_leaf_dirs_skip_parents(tmp_path):
+    batch = FSBatch(tmp_path)
+    batch.mkdir('app')
+    batch.mkdir('app/models')
+    batch.write('app/views/index.py', '')
+
+    expected = [os.path.join('app', 'models'), os.path.join('app', 'views')]
+    assert batch._leaf_dirs() == expected
+
+
+def test_write_into_uncreated_parent(tmp_path):
+    batch = FSBatch(tmp_path / 'project')
+    batch.write('src/pkg/sub/module.py', 'x = 1\n')
+    batch.commit()
+
+    target = tmp_path / 'project' / 'src' / 'pkg' / 'sub' / 'module.py'
+    assert target.read_text(encoding='utf-8') == 'x = 1\n'
+
+
+def test_str_and_bytes_content(tmp_path):
+    batch = FSBatch(tmp_path)
+    batch.write('text.txt', 'olá\nmundo\n')
+    batch.write('data.bin', b'\x00\r\n\xff')
+    batch.commit()
+
+    expected_text = 'olá\nmundo\n'.replace('\n', os.linesep).encode('utf-8')
+    assert (tmp_path / 'text.txt').read_bytes() == expected_text
+    assert (tmp_path / 'data.bin').read_bytes() == b'\x00\r\n\xff'
+
+
+def test_commit_overwrites_and_clears(tmp_path):
+    (tmp_path / 'file.txt').write_bytes(b'old content that is longer')
+    batch = FSBatch(tmp_path)
+    batch.write('file.txt', b'new')
+    batch.commit()
+
+    assert (tmp_path / 'file.txt').read_bytes() == b'new'
+
+    # The scheduled operations are gone after the flush
+    (tmp_path / 'file.txt').unlink()
+    batch.commit()
+    assert not (tmp_path / 'file.txt').exists()
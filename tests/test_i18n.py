@@ -0,0 +1,37 @@
+"""Tests for prozes.modules.i18n."""
+
+import pytest
+
+from prozes.modules import i18n
+
+
+@pytest.fixture
+def english_only_key(monkeypatch):
+    """A placeholder key that exists in English only, with Portuguese active."""
+    key = 'test_english_only'
+    monkeypatch.setitem(i18n._load_lang('en'), key, 'Hello {name} from {place}')
+    # Drop the compiled formatters so the new key is picked up
+    monkeypatch.setattr(i18n, '_FORMATTERS', {})
+    previous = i18n.get_language()
+    i18n.set_language('pt')
+    yield key
+    i18n.set_language(previous)
+
+
+def test_t_formats_english_fallback(english_only_key):
+    assert i18n.t(english_only_key, name='Ana', place='Lisboa') == 'Hello Ana from Lisboa'
+
+
+def test_t_map_formats_english_fallback(english_only_key):
+    mapping = {'name': 'Ana', 'place': 'Lisboa'}
+    assert i18n.t_map(english_only_key, mapping) == 'Hello Ana from Lisboa'
+
+
+def test_english_fallback_keeps_missing_placeholders(english_only_key):
+    assert i18n.t(english_only_key, name='Ana') == 'Hello Ana from {place}'
+    assert i18n.t_map(english_only_key, {'name': 'Ana'}) == 'Hello Ana from {place}'
+
+
+def test_unknown_key_returns_key():
+    assert i18n.t('no_such_key', name='Ana') == 'no_such_key'
+    assert i18n.t_map('no_such_key', {'name': 'Ana'}) == 'no_such_key'
@@ -0,0 +1,29 @@
+"""Tests for prozes.modules.install."""
+
+from prozes.modules import install
+from prozes.modules.fsbatch import FSBatch
+
+
+def test_files_use_native_newline(tmp_path, monkeypatch):
+    monkeypatch.setattr(install, '_NATIVE_NEWLINE', b'\r\n')
+    install.create_default_requirements(tmp_path, 'cli')
+    install.create_env_example(tmp_path, 'api-flask', 'jwt')
+
+    for name in ('requirements.txt', '.env.example'):
+        content = (tmp_path / name).read_bytes()
+        assert content.count(b'\n') == content.count(b'\r\n') > 0
+
+
+def test_batched_files_match_direct_writes(tmp_path):
+    direct = tmp_path / 'direct'
+    direct.mkdir()
+    install.create_default_requirements(direct, 'api-fastapi', 'jwt')
+    install.create_env_example(direct, 'api-fastapi', 'jwt')
+
+    batch = FSBatch(tmp_path / 'batched')
+    install.create_default_requirements(batch.root, 'api-fastapi', 'jwt', batch=batch)
+    install.create_env_example(batch.root, 'api-fastapi', 'jwt', batch=batch)
+    batch.commit()
+
+    for name in ('requirements.txt', '.env.example'):
+        assert (tmp_path / 'batched' / name).read_bytes() == (direct / name).read_bytes()
@@ -0,0 +1,30 @@
+"""Tests for the built-in template registry in prozes.modules.structures."""
+
+import pytest
+
+from prozes.modules.structures import BUILTIN_TEMPLATES, get_builtin_template_list
+
+
+@pytest.mark.parametrize('name', sorted(BUILTIN_TEMPLATES))
+def test_builtin_function_creates_structure(tmp_path, name):
+    BUILTIN_TEMPLATES[name].function(tmp_path / name, verbose=False)
+
+    assert any((tmp_path / name).iterdir())
+
+
+@pytest.mark.parametrize('name', sorted(BUILTIN_TEMPLATES))
+def test_builtin_function_accepts_auth_type(tmp_path, name):
+    BUILTIN_TEMPLATES[name].function(tmp_path / name, verbose=False, auth_type='none')
+
+    assert (tmp_path / name).is_dir()
+
+
+def test_template_info_fields():
+    tpl = BUILTIN_TEMPLATES['cli']
+    assert tpl.name == 'cli'
+    assert callable(tpl.function)
+
+
+def test_builtin_template_list_matches_registry():
+    names = [tpl['name'] for tpl in get_builtin_template_list()]
+    assert names == list(BUILTIN_TEMPLATES)